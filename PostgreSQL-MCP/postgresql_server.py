@@ -5,16 +5,15 @@ Extended from 19 tools to 27 tools with query optimization,
 data management, transactions, and monitoring capabilities.
 """
 
+import asyncio
 from mcp.server.fastmcp import FastMCP
 from typing import Any, Dict, List, Optional, Union
-import json
 
 # Import modular components
-from src.schema import extract_schema
-from src.analysis import detect_junction_tables, suggest_joins
-from src.analysis.detector import detect_implicit_relationships
-from src.generation import generate_plantuml_erd, generate_plantuml_class, generate_plantuml_component, generate_markdown
-from src.generation import DiagramRenderer
+from src.schema import get_cached_schema, get_tables_list
+from src.schema import cache as schema_cache
+from src.analysis import analyze_schema
+from src.generation import generate_plantuml_erd, generate_plantuml_class, generate_plantuml_component, generate_markdown, generate_table_documentation
 from src.generation.diagram_renderer import render_database_diagrams as render_diagrams_impl
 from src.llm import OllamaAnalyzer
 
@@ -32,6 +31,7 @@ from src.crud import (
     paginate_data,
     update_record,
     update_records_batch,
+    update_records_bulk,
     update_column,
     rename_table,
     rename_column,
@@ -105,14 +105,12 @@ def analyze_database() -> Dict[str, Any]:
     - Comprehensive Markdown documentation
     """
     try:
-        schema = extract_schema()
+        schema = get_cached_schema()
 
         return {
             "status": "success",
             "schema": schema,
-            "junction_tables": detect_junction_tables(schema),
-            "implicit_relationships": detect_implicit_relationships(schema),
-            "suggested_joins": suggest_joins(schema),
+            **analyze_schema(schema),
             "plantuml_erd": generate_plantuml_erd(schema),
             "plantuml_class": generate_plantuml_class(schema),
             "plantuml_component": generate_plantuml_component(schema),
@@ -126,7 +124,7 @@ def analyze_database() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def explain_database() -> Dict[str, Any]:
+async def explain_database() -> Dict[str, Any]:
     """
     Use LLM (Ollama) to generate AI-powered database explanation.
     
@@ -138,17 +136,28 @@ def explain_database() -> Dict[str, Any]:
     - Database quality insights
     """
     try:
-        schema = extract_schema()
         analyzer = OllamaAnalyzer()
         
-        # Check if Ollama is available
-        if not analyzer.is_available():
+        # Run the blocking extraction and LLM call off the event loop; an
+        # unreachable server or missing model surfaces as an error dict
+        schema = await asyncio.to_thread(get_cached_schema)
+        
+        # An unchanged schema reuses the stored answer instead of re-running the model
+        cached = await asyncio.to_thread(analyzer.get_cached_explanation, schema)
+        if cached is not None:
             return {
-                "status": "error",
-                "error": f"Ollama model '{analyzer.model}' not available at {analyzer.base_url}"
+                "status": "success",
+                "llm_analysis": cached,
+                "cached": True
             }
         
-        result = analyzer.explain_schema(schema)
+        result = await asyncio.to_thread(analyzer.explain_schema, schema)
+        
+        if "error" in result:
+            return {
+                "status": "error",
+                "error": f"Ollama model '{analyzer.model}' at {analyzer.base_url}: {result['error']}"
+            }
         
         return {
             "status": "success",
@@ -173,7 +182,7 @@ def get_table_details(table_name: str) -> Dict:
         Detailed table structure, relationships, and documentation
     """
     try:
-        schema = extract_schema()
+        schema = get_cached_schema()
         
         if table_name not in schema:
             return {
@@ -184,8 +193,6 @@ def get_table_details(table_name: str) -> Dict:
         table_info = schema[table_name]
         
         # Generate documentation for this table
-        from src.generation.markdown_gen import generate_table_documentation
-        
         return {
             "status": "success",
             "table_name": table_name,
@@ -215,7 +222,6 @@ def get_database_info(info_type: str = "tables") -> Dict[str, Any]:
     """
     try:
         if info_type == "tables":
-            from src.schema.extractor import get_tables_list
             tables = get_tables_list()
             return {
                 "status": "success",
@@ -238,7 +244,6 @@ def get_database_info(info_type: str = "tables") -> Dict[str, Any]:
             }
             
         elif info_type == "summary":
-            from src.schema.extractor import get_tables_list
             tables = get_tables_list()
             return {
                 "status": "success",
@@ -276,7 +281,7 @@ def render_database_diagrams(output_format: str = "svg") -> Dict[str, Any]:
         Paths to generated diagram files in the 'diagrams/' directory
     """
     try:
-        schema = extract_schema()
+        schema = get_cached_schema()
         diagrams = render_diagrams_impl(
             schema,
             output_dir="diagrams",
@@ -305,6 +310,25 @@ def render_database_diagrams(output_format: str = "svg") -> Dict[str, Any]:
         }
 
 
+@mcp.tool()
+def invalidate_schema_cache() -> Dict[str, Any]:
+    """
+    Discard the cached database schema.
+    
+    Analysis tools reuse the extracted schema for up to 30 seconds. Schema
+    changes made through this server refresh it automatically; call this after
+    changing the schema outside the server (e.g. migrations, psql).
+    
+    Returns:
+        Status confirming the cache was cleared
+    """
+    schema_cache.invalidate()
+    return {
+        "status": "success",
+        "message": "Schema cache cleared"
+    }
+
+
 
 # ============================================
 # CATEGORY 2: CRUD CREATE OPERATIONS (3 tools)
@@ -416,7 +440,9 @@ def crud_query(
     query: str, 
     params: Optional[List[Any]] = None, 
     limit: Optional[int] = None, 
-    offset: Optional[int] = None
+    offset: Optional[int] = None,
+    fetch_size: int = 2000,
+    as_dicts: bool = True
 ) -> Dict[str, Any]:
     """
     Execute a raw SELECT query with optional parameters and pagination.
@@ -424,11 +450,17 @@ def crud_query(
     Use this for complex queries with JOINs, aggregations, or custom logic.
     For simple table queries, use crud_get() instead.
     
+    The query runs in a read-only transaction that is always rolled back,
+    so data-modifying statements fail and nothing is committed.
+    
     Args:
         query: SELECT query to execute (use %s for parameterized values)
         params: Optional list of parameter values to substitute in query
         limit: Optional maximum number of records to return
         offset: Optional number of records to skip (for pagination)
+        fetch_size: Rows fetched per round-trip for large results (server-side cursor)
+        as_dicts: Rows as {column: value} dicts (default); False returns value
+                  lists in 'columns' order, a much smaller payload for wide results
         
     Example:
         query = "SELECT * FROM users WHERE age > %s AND city = %s"
@@ -437,7 +469,7 @@ def crud_query(
     Returns:
         Result with query results, column names, and row count
     """
-    return query_data(query, params, limit, offset)
+    return query_data(query, params, limit, offset, fetch_size, as_dicts)
 
 
 @mcp.tool()
@@ -461,10 +493,17 @@ def crud_get(
         where_clause: Optional SQL WHERE clause (use %s for parameters)
         where_params: Optional list of values for WHERE clause parameters
         options: Optional dict with mode-specific options:
-            For "records": {limit, offset, order_by, column_name}
-            For "count": (no additional options)
-            For "distinct": {column_name, limit}
-            For "paginate": {page, page_size, order_by}
+            For "records": {limit, offset, order_by, fetch_size, as_dicts, columns}
+            For "count": {exact, refresh_count} (exact=False returns the planner's
+                estimate for unfiltered counts, in constant time; exact counts are
+                reused for 30s and reported with "cached": true)
+            For "distinct": {column_name, limit, use_index_skip} (use_index_skip walks a
+                btree index on the column; fast for low-cardinality columns)
+            For "paginate": {page, page_size, order_by, refresh_count, include_total, columns} or, for
+                keyset paging on large tables, {cursor_column, cursor, page_size, columns}
+                (pass the previous page's next_cursor as cursor)
+            columns limits the result to the listed columns (default: all);
+            include_total=False skips counting and only reports has_next
             
     Examples:
         - Get records: mode="records", where_clause="age > %s", where_params=[30], 
@@ -472,6 +511,7 @@ def crud_get(
         - Count: mode="count", where_clause="status = %s", where_params=["active"]
         - Distinct: mode="distinct", options={"column_name": "city", "limit": 50}
         - Paginate: mode="paginate", options={"page": 2, "page_size": 20}
+        - Keyset paginate: mode="paginate", options={"cursor_column": "id", "cursor": 120, "page_size": 20}
     
     Returns:
         Result with data based on selected mode
@@ -486,14 +526,19 @@ def crud_get(
                 where_params=where_params,
                 limit=options.get("limit"),
                 offset=options.get("offset"),
-                order_by=options.get("order_by")
+                order_by=options.get("order_by"),
+                fetch_size=options.get("fetch_size", 2000),
+                as_dicts=options.get("as_dicts", True),
+                columns=options.get("columns")
             )
             
         elif mode == "count":
             return get_record_count(
                 table_name,
                 where_clause=where_clause,
-                where_params=where_params
+                where_params=where_params,
+                exact=options.get("exact", True),
+                refresh_count=options.get("refresh_count", False)
             )
             
         elif mode == "distinct":
@@ -506,7 +551,8 @@ def crud_get(
             return distinct_values(
                 table_name,
                 column_name,
-                limit=options.get("limit")
+                limit=options.get("limit"),
+                use_index_skip=options.get("use_index_skip", False)
             )
             
         elif mode == "paginate":
@@ -516,7 +562,12 @@ def crud_get(
                 page_size=options.get("page_size", 10),
                 order_by=options.get("order_by"),
                 where_clause=where_clause,
-                where_params=where_params
+                where_params=where_params,
+                cursor=options.get("cursor"),
+                cursor_column=options.get("cursor_column"),
+                refresh_count=options.get("refresh_count", False),
+                columns=options.get("columns"),
+                include_total=options.get("include_total", True)
             )
             
         else:
@@ -542,15 +593,18 @@ def crud_update(
     where_clause: Optional[str] = None,
     where_params: Optional[List[Any]] = None,
     id_column: Optional[str] = None,
-    record_id: Optional[Any] = None
+    record_id: Optional[Any] = None,
+    rows: Optional[List[Dict[str, Any]]] = None,
+    returning: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
-    Update records in a table (supports single, batch, and column updates).
+    Update records in a table (supports single, batch, column, and bulk keyed updates).
     
-    Three update modes:
+    Four update modes:
     1. Single record by ID: Provide record_id and id_column
     2. Batch update: Provide where_clause and where_params
     3. Column-only update: Use special key "_column_only" in values
+    4. Bulk keyed update: Provide rows and id_column; each row carries its own values
     
     Args:
         table_name: Name of the table to update
@@ -559,34 +613,43 @@ def crud_update(
         where_params: Optional list of values for WHERE clause parameters
         id_column: Column name for ID-based updates (e.g., "id", "user_id")
         record_id: ID value for single record update
+        rows: List of row dicts for bulk keyed updates, each including id_column
+              (values is ignored in this mode)
+        returning: Optional columns (or ["*"]) of the updated rows to return under
+                   result["returned"]; not supported for bulk keyed updates
         
     Examples:
         - Single record: record_id=123, id_column="id", values={"name": "John", "age": 30}
         - Batch update: where_clause="age > %s", where_params=[30], values={"status": "active"}
         - Column update: values={"status": "active"}, where_clause="city = %s", where_params=["NYC"]
+        - Bulk keyed update: id_column="id", values={}, rows=[{"id": 1, "age": 31}, {"id": 2, "age": 45}]
         
     Returns:
         Result with status, updated count, and operation details
     """
     try:
+        # Bulk update, one UPDATE ... FROM (VALUES ...) per page
+        if rows and id_column:
+            return update_records_bulk(table_name, id_column, rows)
+        
         # Single record update by ID
         if record_id is not None and id_column:
-            return update_record(table_name, record_id, id_column, values)
+            return update_record(table_name, record_id, id_column, values, returning)
         
         # Batch or column update
         elif where_clause and where_params:
             # Check if it's a single-column bulk update
-            if len(values) == 1 and "_column_only" not in values:
+            if len(values) == 1 and "_column_only" not in values and not returning:
                 column_name = list(values.keys())[0]
                 new_value = values[column_name]
                 return update_column(table_name, column_name, new_value, where_clause, where_params)
             else:
-                return update_records_batch(table_name, where_clause, where_params, values)
+                return update_records_batch(table_name, where_clause, where_params, values, returning)
         
         else:
             return {
                 "status": "error",
-                "error": "Must provide either (record_id + id_column) or (where_clause + where_params)"
+                "error": "Must provide (record_id + id_column), (rows + id_column) or (where_clause + where_params)"
             }
     except Exception as e:
         return {
@@ -656,7 +719,11 @@ def crud_delete(
     where_params: Optional[List[Any]] = None,
     id_column: Optional[str] = None,
     record_id: Optional[Any] = None,
-    cascade: bool = False
+    cascade: bool = False,
+    returning: Optional[List[str]] = None,
+    chunk_size: Optional[int] = None,
+    restart_identity: bool = False,
+    if_exists: bool = False
 ) -> Dict[str, Any]:
     """
     Delete data or drop tables (unified deletion operations).
@@ -671,7 +738,15 @@ def crud_delete(
         where_params: List of values for WHERE clause parameters
         id_column: Column name for single record deletion by ID (e.g., "id")
         record_id: ID value for single record deletion
-        cascade: For "drop" mode, also drop dependent objects (views, foreign keys, etc.)
+        cascade: For "drop" mode, also drop dependent objects (views, foreign keys, etc.);
+                 for "truncate" mode, also truncate tables referencing this one
+        returning: For "records" mode, columns (or ["*"]) of the deleted rows to return
+                   under result["returned"]
+        chunk_size: For WHERE-clause deletes, delete and commit at most this many rows at
+                    a time (keyed on id_column, default "id") to keep locks short on
+                    large deletions; the deletion is then not atomic
+        restart_identity: For "truncate" mode, also reset the table's sequences
+        if_exists: For "drop" mode, succeed without error if the table is missing
         
     Examples:
         - Delete single: mode="records", record_id=123, id_column="id"
@@ -686,10 +761,17 @@ def crud_delete(
         if mode == "records":
             # Single record deletion by ID
             if record_id is not None and id_column:
-                return delete_record(table_name, record_id, id_column)
+                return delete_record(table_name, record_id, id_column, returning)
             # Batch deletion with WHERE clause
             elif where_clause and where_params:
-                return delete_records(table_name, where_clause, where_params)
+                return delete_records(
+                    table_name,
+                    where_clause,
+                    where_params,
+                    returning,
+                    chunk_size=chunk_size,
+                    id_column=id_column or "id"
+                )
             else:
                 return {
                     "status": "error",
@@ -697,10 +779,10 @@ def crud_delete(
                 }
                 
         elif mode == "truncate":
-            return truncate_table(table_name)
+            return truncate_table(table_name, restart_identity, cascade)
             
         elif mode == "drop":
-            return drop_table(table_name, cascade)
+            return drop_table(table_name, cascade, if_exists)
             
         else:
             return {
@@ -1,5 +1,5 @@
 """Analysis module for SchemaIntelligence"""
 
-from .detector import detect_junction_tables, suggest_joins
+from .detector import analyze_schema, detect_junction_tables, suggest_joins
 
-__all__ = ["detect_junction_tables", "suggest_joins"]
+__all__ = ["analyze_schema", "detect_junction_tables", "suggest_joins"]
@@ -12,17 +12,20 @@ load_dotenv()
 class DatabaseConfig:
     """Database connection configuration"""
     HOST = os.getenv("DB_HOST", "localhost")
-    PORT = os.getenv("DB_PORT", "6739")
+    PORT = int(os.getenv("DB_PORT", "6739"))
     DATABASE = os.getenv("DB_NAME")
     USER = os.getenv("DB_USER", "postgres")
     PASSWORD = os.getenv("DB_PASSWORD", )
+    # Connection pool bounds (idle connections kept / max checked out at once)
+    POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+    POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
 
     @classmethod
     def to_dict(cls):
         """Convert config to connection dictionary"""
         return {
             "host": cls.HOST,
-            "port": int(cls.PORT) if isinstance(cls.PORT, str) else cls.PORT,
+            "port": cls.PORT,
             "database": cls.DATABASE,
             "user": cls.USER,
             "password": cls.PASSWORD,
@@ -34,6 +37,7 @@ class OllamaConfig:
     BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://192.168.1.143:11434")
     MODEL = os.getenv("OLLAMA_MODEL", "deepseek-r1:14b")
     TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "30"))
+    CACHE_DIR = os.getenv("OLLAMA_CACHE_DIR", ".cache/llm")
 
 
 class AppConfig:
@@ -17,6 +17,7 @@ from .crud_manager import (
     paginate_data,
     update_record,
     update_records_batch,
+    update_records_bulk,
     update_column,
     rename_table,
     rename_column,
@@ -24,6 +25,7 @@ from .crud_manager import (
     delete_records,
     truncate_table,
     drop_table,
+    invalidate_counts,
 )
 
 __all__ = [
@@ -40,6 +42,7 @@ __all__ = [
     "paginate_data",
     "update_record",
     "update_records_batch",
+    "update_records_bulk",
     "update_column",
     "rename_table",
     "rename_column",
@@ -47,4 +50,5 @@ __all__ = [
     "delete_records",
     "truncate_table",
     "drop_table",
+    "invalidate_counts",
 ]
@@ -3,11 +3,38 @@ CRUD Manager: Handle Create, Read, Update, Delete operations for PostgreSQL.
 All operations are parameterized for SQL injection prevention.
 """
 
+import io
 import time
-from typing import Any, Dict, List, Optional, Tuple
-from src.database import get_connection
+import uuid
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from psycopg2.extras import execute_values
+from src.database import pg_cursor
+from src.schema import cache as schema_cache
 from .crud_validator import CRUDValidator
 
+# Rows packed into each multi-row INSERT statement by create_records_batch
+BATCH_PAGE_SIZE = 1000
+
+# Distinct (table, columns) INSERT statements kept by _insert_sql
+INSERT_SQL_CACHE_SIZE = 512
+
+# Distinct UPDATE statement shapes kept by _update_sql / _bulk_update_sql
+UPDATE_SQL_CACHE_SIZE = 512
+
+# Batches at least this large are streamed with COPY instead of INSERT
+COPY_THRESHOLD = 1000
+
+# Rows per round-trip when a large SELECT is read through a server-side cursor
+DEFAULT_FETCH_SIZE = 2000
+
+# Seconds an exact count is reused for the same table and filter
+COUNT_CACHE_TTL = 30
+COUNT_CACHE_MAX_ENTRIES = 256
+
+# (table_name, where_clause, where_params) -> (total_count, counted_at)
+_count_cache: Dict[Tuple, Tuple[int, float]] = {}
+
 
 def _format_result(
     status: str,
@@ -29,7 +56,7 @@ def _format_result(
         result: operation-specific result data
         message: human-readable message
         warnings: list of warning messages
-        
+    
     Returns:
         Standardized result dictionary
     """
@@ -44,124 +71,259 @@ def _format_result(
     }
 
 
+def crud_op(
+    operation: str,
+    invalidates_schema: bool = False,
+    modifies_data: bool = False,
+    autocommit: bool = False,
+    readonly: bool = False,
+) -> Callable:
+    """
+    Decorator that runs a CRUD operation on a pooled cursor.
+    
+    The wrapped function receives the cursor as its first argument and
+    returns the _format_result() fields for a successful run (status
+    defaults to 'success'). Timing, commit and error formatting are
+    handled here, so callers keep the original signature without `cur`.
+    
+    Callers may pass conn= (from src.database.transaction()) to run the
+    operation inside their transaction. It is then not committed here,
+    and errors are raised instead of formatted so the transaction rolls
+    back as a whole.
+    
+    Args:
+        operation: name reported in the result's 'operation' field
+        invalidates_schema: drop the cached schema after a successful commit (DDL)
+        modifies_data: drop cached pagination counts after a successful commit
+        autocommit: run without BEGIN/COMMIT round-trips (single-statement
+            writes and plain reads)
+        readonly: run in a READ ONLY transaction that is rolled back instead
+            of committed (reads that need a transaction, e.g. for a
+            server-side cursor)
+    """
+    def decorator(fn: Callable[..., Dict]) -> Callable[..., Dict]:
+        @wraps(fn)
+        def wrapper(*args, conn=None, **kwargs) -> Dict:
+            start = time.perf_counter()
+            try:
+                with pg_cursor(conn, autocommit=autocommit, readonly=readonly) as cur:
+                    fields = fn(cur, *args, **kwargs)
+                if invalidates_schema:
+                    schema_cache.invalidate()
+                if modifies_data or invalidates_schema:
+                    invalidate_counts()
+                fields.setdefault("status", "success")
+                return _format_result(
+                    operation=operation,
+                    duration_ms=(time.perf_counter() - start) * 1000,
+                    **fields
+                )
+            except Exception as e:
+                if conn is not None:
+                    raise
+                return _format_result(
+                    status="error",
+                    operation=operation,
+                    duration_ms=(time.perf_counter() - start) * 1000,
+                    message=str(e)
+                )
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=INSERT_SQL_CACHE_SIZE)
+def _insert_sql(table_name: str, columns: Tuple[str, ...], batch: bool = False) -> str:
+    """
+    Build the INSERT statement for a table/column signature.
+    
+    Args:
+        table_name: Validated table name
+        columns: Column names in the order their values are passed
+        batch: Emit a single VALUES %s slot for execute_values()
+    
+    Returns:
+        INSERT statement text
+    """
+    col_names = ','.join(columns)
+    if batch:
+        return f"INSERT INTO {table_name} ({col_names}) VALUES %s"
+    placeholders = ','.join(['%s'] * len(columns))
+    return f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=UPDATE_SQL_CACHE_SIZE)
+def _update_sql(table_name: str, columns: Tuple[str, ...], where_clause: str) -> str:
+    """Build the UPDATE statement for a table/column signature and filter."""
+    set_clause = ','.join([f"{col}=%s" for col in columns])
+    return f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
+
+
+@lru_cache(maxsize=UPDATE_SQL_CACHE_SIZE)
+def _bulk_update_sql(table_name: str, key_column: str, columns: Tuple[str, ...]) -> str:
+    """
+    Build an UPDATE ... FROM (VALUES %s) statement for execute_values().
+    
+    Args:
+        table_name: Validated table name
+        key_column: Column matching each VALUES row to its target row
+        columns: Key column first, then the columns to set
+    
+    Returns:
+        UPDATE statement text
+    """
+    set_clause = ','.join([f"{col}=v.{col}" for col in columns[1:]])
+    return (
+        f"UPDATE {table_name} AS t SET {set_clause} "
+        f"FROM (VALUES %s) AS v ({','.join(columns)}) "
+        f"WHERE t.{key_column} = v.{key_column}"
+    )
+
+
+def _values_template(cur, table_name: str, columns: Tuple[str, ...]) -> str:
+    """
+    Build an execute_values() row template casting each slot to its column type.
+    
+    Literals in a VALUES list are otherwise typed on their own (quoted
+    strings become text), which breaks SET/WHERE on non-text columns.
+    """
+    cur.execute(
+        "SELECT attname, atttypid::regtype::text FROM pg_attribute "
+        "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+        [table_name]
+    )
+    types = dict(cur.fetchall())
+    missing = [col for col in columns if col not in types]
+    if missing:
+        raise ValueError(f"Unknown column(s) in '{table_name}': {', '.join(missing)}")
+    return '(' + ','.join([f"%s::{types[col]}" for col in columns]) + ')'
+
+
+def _csv_field(value: Any) -> str:
+    """Render a scalar as a PostgreSQL CSV field (unquoted empty = NULL)."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return repr(value)
+
+
+def _is_copy_safe(value: Any) -> bool:
+    """
+    Whether _csv_field() renders the value as text the column's input
+    function reads back as the same value.
+    
+    Floats are excluded: repr() gives forms like '1.0' or '1e+20' that an
+    integer column rejects as text, while INSERT casts the numeric value.
+    """
+    # Exact types only: subclasses (IntEnum, str enums, ...) may render differently
+    return value is None or type(value) in (str, bool, int)
+
+
+def _accepts_copy(cur, table_name: str) -> bool:
+    """
+    Whether COPY behaves like INSERT for the target: a plain or partitioned
+    table without rules (COPY fails on views and ignores INSERT rules).
+    """
+    cur.execute(
+        "SELECT relkind IN ('r', 'p') AND NOT relhasrules FROM pg_class WHERE oid = %s::regclass",
+        [table_name]
+    )
+    row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def _copy_records(cur, table_name: str, columns: Tuple[str, ...], rows: List[Tuple]) -> None:
+    """Stream rows into a table with COPY ... FROM STDIN (CSV)."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write(",".join([_csv_field(value) for value in row]))
+        buf.write("\n")
+    buf.seek(0)
+    cur.copy_expert(
+        f"COPY {table_name} ({','.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        buf
+    )
+
+
 # ============================================
 # CREATE OPERATIONS
 # ============================================
 
-def create_record(table_name: str, values: Dict[str, Any]) -> Dict:
+@crud_op("create_record", modifies_data=True)
+def create_record(cur, table_name: str, values: Dict[str, Any]) -> Dict:
     """
     Insert a single record into a table (parameterized).
     
     Args:
         table_name: Name of the table
         values: Dictionary of column_name: value pairs
-        
+    
     Returns:
         Result with inserted record count
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_values_dict(values)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_values_dict(values)
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        # Build INSERT query with placeholders
-        columns = list(values.keys())
-        placeholders = ','.join(['%s'] * len(columns))
-        col_names = ','.join(columns)
-        
-        query = f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
-        values_list = [values[col] for col in columns]
-        
-        cur.execute(query, values_list)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="create_record",
-            rows_affected=1,
-            duration_ms=duration,
-            message=f"Record inserted successfully into '{table_name}'"
-        )
+    # Build INSERT query with placeholders (cached per column signature)
+    columns = tuple(values)
+    query = _insert_sql(table_name, columns)
+    values_list = [values[col] for col in columns]
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="create_record",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    cur.execute(query, values_list)
+    
+    return {
+        "rows_affected": 1,
+        "message": f"Record inserted successfully into '{table_name}'",
+    }
 
 
-def create_records_batch(table_name: str, records: List[Dict[str, Any]]) -> Dict:
+@crud_op("create_records_batch", modifies_data=True)
+def create_records_batch(cur, table_name: str, records: List[Dict[str, Any]]) -> Dict:
     """
     Insert multiple records in a batch (more efficient than single inserts).
     
     Args:
         table_name: Name of the table
         records: List of dictionaries with column_name: value pairs
-        
+    
     Returns:
         Result with number of inserted records
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_values_list(records)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_values_list(records)
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        # Get column structure from first record
-        columns = list(records[0].keys())
-        placeholders = ','.join(['%s'] * len(columns))
-        col_names = ','.join(columns)
-        
-        query = f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
-        
-        # Prepare all value tuples
-        values_tuples = [
-            tuple(record[col] for col in columns)
-            for record in records
-        ]
-        
-        # Execute batch insert
-        cur.executemany(query, values_tuples)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        rows_affected = len(records)
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="create_records_batch",
-            rows_affected=rows_affected,
-            duration_ms=duration,
-            message=f"Batch inserted {rows_affected} records into '{table_name}'"
-        )
+    # Get column structure from first record
+    columns = tuple(records[0])
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="create_records_batch",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    # Prepare all value tuples
+    values_tuples = [
+        tuple(record[col] for col in columns)
+        for record in records
+    ]
+    
+    if len(values_tuples) >= COPY_THRESHOLD and all(
+        _is_copy_safe(value) for row in values_tuples for value in row
+    ) and _accepts_copy(cur, table_name):
+        # Large batch of plain scalars: COPY skips per-statement parsing
+        _copy_records(cur, table_name, columns, values_tuples)
+    else:
+        # Execute batch insert as multi-row INSERTs (one round-trip per page)
+        query = _insert_sql(table_name, columns, batch=True)
+        execute_values(cur, query, values_tuples, page_size=BATCH_PAGE_SIZE)
+    
+    rows_affected = len(records)
+    
+    return {
+        "rows_affected": rows_affected,
+        "message": f"Batch inserted {rows_affected} records into '{table_name}'",
+    }
 
 
+@crud_op("create_table", invalidates_schema=True)
 def create_table(
+    cur,
     table_name: str,
     columns: List[Dict[str, Any]],
     primary_key: Optional[List[str]] = None,
@@ -178,84 +340,58 @@ def create_table(
                 {"name": "email", "type": "VARCHAR(255)", "nullable": True},
             ]
         primary_key: List of column names for primary key ['id'] or ['org_id', 'project_id']
-        
+    
     Returns:
         Result of table creation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        
-        # Validate columns
-        if not columns or not isinstance(columns, list):
-            raise ValueError("Columns must be a non-empty list")
-        
-        col_definitions = []
-        for col in columns:
-            name = col.get("name")
-            dtype = col.get("type")
-            nullable = col.get("nullable", True)
-            
-            CRUDValidator.validate_column_name(name)
-            CRUDValidator.validate_column_type(dtype)
-            
-            null_str = "" if nullable else " NOT NULL"
-            col_definitions.append(f"{name} {dtype}{null_str}")
-        
-        # Add primary key constraint if specified
-        if primary_key:
-            CRUDValidator.validate_primary_key(primary_key)
-            pk_cols = ','.join(primary_key)
-            col_definitions.append(f"PRIMARY KEY ({pk_cols})")
-        
-        col_def_str = ',\n  '.join(col_definitions)
-        query = f"CREATE TABLE {table_name} (\n  {col_def_str}\n)"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(query)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
+    # Validate columns
+    if not columns or not isinstance(columns, list):
+        raise ValueError("Columns must be a non-empty list")
+    
+    col_definitions = []
+    for col in columns:
+        name = col.get("name")
+        dtype = col.get("type")
+        nullable = col.get("nullable", True)
         
-        cur.close()
-        conn.close()
+        CRUDValidator.validate_column_name(name)
+        CRUDValidator.validate_column_type(dtype)
         
-        return _format_result(
-            status="success",
-            operation="create_table",
-            duration_ms=duration,
-            message=f"Table '{table_name}' created successfully",
-            result={"columns": len(columns), "has_primary_key": bool(primary_key)}
-        )
+        null_str = "" if nullable else " NOT NULL"
+        col_definitions.append(f"{name} {dtype}{null_str}")
     
+    # Add primary key constraint if specified
+    if primary_key:
+        CRUDValidator.validate_primary_key(primary_key)
+        pk_cols = ','.join(primary_key)
+        col_definitions.append(f"PRIMARY KEY ({pk_cols})")
+    
+    col_def_str = ',\n  '.join(col_definitions)
+    query = f"CREATE TABLE {table_name} (\n  {col_def_str}\n)"
+    
+    try:
+        cur.execute(query)
     except Exception as e:
         error_msg = str(e)
         if "already exists" in error_msg:
-            return _format_result(
-                status="error",
-                operation="create_table",
-                duration_ms=(time.time() - start) * 1000,
-                message=f"Table '{table_name}' already exists in the database."
-            )
+            raise ValueError(f"Table '{table_name}' already exists in the database.") from e
         elif "syntax error" in error_msg:
-            return _format_result(
-                status="error",
-                operation="create_table",
-                duration_ms=(time.time() - start) * 1000,
-                message=f"Syntax error generating the table '{table_name}'. Try again with standard SQL parameters. Detail: {error_msg}"
-            )
-            
-        return _format_result(
-            status="error",
-            operation="create_table",
-            duration_ms=(time.time() - start) * 1000,
-            message=error_msg
-        )
+            raise ValueError(
+                f"Syntax error generating the table '{table_name}'. Try again with standard SQL parameters. Detail: {error_msg}"
+            ) from e
+        raise
+    
+    return {
+        "message": f"Table '{table_name}' created successfully",
+        "result": {"columns": len(columns), "has_primary_key": bool(primary_key)},
+    }
 
 
+@crud_op("create_view")
 def create_view(
+    cur,
     view_name: str,
     select_query: str,
     replace_if_exists: bool = False,
@@ -267,48 +403,26 @@ def create_view(
         view_name: Name of the new view
         select_query: SELECT query to use for the view
         replace_if_exists: Use CREATE OR REPLACE (must have same columns)
-        
+    
     Returns:
         Result of view creation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(view_name)
     
-    try:
-        CRUDValidator.validate_table_name(view_name)
-        
-        if not select_query or not isinstance(select_query, str):
-            raise ValueError("select_query must be a non-empty string")
-        
-        create_or_replace = "CREATE OR REPLACE" if replace_if_exists else "CREATE"
-        query = f"{create_or_replace} VIEW {view_name} AS {select_query}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(query)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="create_view",
-            duration_ms=duration,
-            message=f"View '{view_name}' created successfully"
-        )
+    if not select_query or not isinstance(select_query, str):
+        raise ValueError("select_query must be a non-empty string")
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="create_view",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    create_or_replace = "CREATE OR REPLACE" if replace_if_exists else "CREATE"
+    query = f"{create_or_replace} VIEW {view_name} AS {select_query}"
+    
+    cur.execute(query)
+    
+    return {"message": f"View '{view_name}' created successfully"}
 
 
+@crud_op("create_index")
 def create_index(
+    cur,
     index_name: str,
     table_name: str,
     columns: List[str],
@@ -322,92 +436,118 @@ def create_index(
         table_name: Table to create index on
         columns: List of column names ["name"] or ["first_name", "last_name"]
         unique: Whether to create a UNIQUE index
-        
+    
     Returns:
         Result of index creation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(index_name)
+    CRUDValidator.validate_table_name(table_name)
     
-    try:
-        CRUDValidator.validate_table_name(index_name)
-        CRUDValidator.validate_table_name(table_name)
-        
-        if not columns or not isinstance(columns, list):
-            raise ValueError("Columns must be a non-empty list")
-        
-        for col in columns:
-            CRUDValidator.validate_column_name(col)
-        
-        unique_str = "UNIQUE " if unique else ""
-        col_str = ','.join(columns)
-        query = f"CREATE {unique_str}INDEX {index_name} ON {table_name} ({col_str})"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute(query)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="create_index",
-            duration_ms=duration,
-            message=f"Index '{index_name}' created on '{table_name}({col_str})'",
-            result={"unique": unique, "column_count": len(columns)}
-        )
+    if not columns or not isinstance(columns, list):
+        raise ValueError("Columns must be a non-empty list")
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="create_index",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    for col in columns:
+        CRUDValidator.validate_column_name(col)
+    
+    unique_str = "UNIQUE " if unique else ""
+    col_str = ','.join(columns)
+    query = f"CREATE {unique_str}INDEX {index_name} ON {table_name} ({col_str})"
+    
+    cur.execute(query)
+    
+    return {
+        "message": f"Index '{index_name}' created on '{table_name}({col_str})'",
+        "result": {"unique": unique, "column_count": len(columns)},
+    }
 
 
 # ============================================
 # READ OPERATIONS
 # ============================================
 
+def _rows_to_dicts(col_names: List[str], rows: List[Tuple]) -> List[Dict[str, Any]]:
+    """Pair every row with the column names."""
+    return [dict(zip(col_names, row)) for row in rows]
+
+
+def _projection(columns: Optional[List[str]]) -> str:
+    """Build the SELECT list for the requested columns ('*' when none are given)."""
+    if not columns:
+        return "*"
+    for col in columns:
+        CRUDValidator.validate_column_name(col)
+    return ", ".join(columns)
+
+
+def _uses_server_cursor(limit: Optional[int], fetch_size: int) -> bool:
+    """Server-side cursors only pay off when more than one batch may come back."""
+    if not isinstance(fetch_size, int) or fetch_size < 1:
+        raise ValueError("fetch_size must be a positive integer")
+    return limit is None or limit > fetch_size
+
+
+def _fetch_streamed(cur, query: str, params: Optional[List[Any]], fetch_size: int) -> Tuple[List[str], List[Tuple]]:
+    """
+    Run a SELECT on a named (server-side) cursor sharing cur's transaction.
+    
+    Rows are pulled fetch_size at a time instead of the whole result being
+    buffered by libpq before the first row is available.
+    
+    Returns:
+        (column names, rows)
+    """
+    with cur.connection.cursor(name=f"stream_{uuid.uuid4().hex}") as named:
+        named.itersize = fetch_size
+        named.execute(query, params)
+        rows = list(named)
+        col_names = [desc[0] for desc in named.description] if named.description else []
+    return col_names, rows
+
+
+@crud_op("query_data", readonly=True)
 def query_data(
+    cur,
     query: str,
     params: Optional[List[Any]] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fetch_size: int = DEFAULT_FETCH_SIZE,
+    as_dicts: bool = True,
 ) -> Dict:
     """
     Execute a SELECT query with optional pagination.
     
+    Runs in a read-only transaction that is rolled back, so statements
+    other than reads fail and nothing is ever committed.
+    
     Args:
         query: SELECT SQL query (can use %s for parameterized values)
         params: List of parameter values to substitute in query
         limit: Maximum number of rows to return
         offset: Number of rows to skip
-        
+        fetch_size: Rows per round-trip when streaming a large SELECT
+        as_dicts: Return each row as a {column: value} dict; False returns
+            plain value lists in 'columns' order (smaller, no per-row dicts)
+    
     Returns:
         Result with rows and metadata
     """
-    start = time.time()
+    if not query or not isinstance(query, str):
+        raise ValueError("Query must be a non-empty string")
     
-    try:
-        if not query or not isinstance(query, str):
-            raise ValueError("Query must be a non-empty string")
-        
-        CRUDValidator.validate_limit_offset(limit, offset)
-        
-        # Add LIMIT/OFFSET to query if specified
-        if limit is not None or offset is not None:
-            limit_str = f"LIMIT {limit}" if limit is not None else ""
-            offset_str = f"OFFSET {offset}" if offset is not None else ""
-            query = f"{query} {limit_str} {offset_str}".strip()
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
+    CRUDValidator.validate_limit_offset(limit, offset)
+    
+    # Add LIMIT/OFFSET to query if specified
+    if limit is not None or offset is not None:
+        limit_str = f"LIMIT {limit}" if limit is not None else ""
+        offset_str = f"OFFSET {offset}" if offset is not None else ""
+        query = f"{query} {limit_str} {offset_str}".strip()
+    
+    # Only plain SELECT/WITH statements can be declared as a server-side cursor
+    first_word = query.lstrip()[:6].upper()
+    if first_word.startswith(("SELECT", "WITH")) and _uses_server_cursor(limit, fetch_size):
+        col_names, rows = _fetch_streamed(cur, query, params or None, fetch_size)
+    else:
         if params:
             cur.execute(query, params)
         else:
@@ -415,44 +555,36 @@ def query_data(
         
         rows = cur.fetchall()
         col_names = [desc[0] for desc in cur.description] if cur.description else []
-        
-        # Convert rows to list of dicts
-        results = [dict(zip(col_names, row)) for row in rows]
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="query_data",
-            rows_affected=len(results),
-            duration_ms=duration,
-            result={"rows": results, "columns": col_names},
-            message=f"Query returned {len(results)} rows"
-        )
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="query_data",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    # Convert rows to list of dicts
+    results = _rows_to_dicts(col_names, rows) if as_dicts else rows
+    
+    return {
+        "rows_affected": len(results),
+        "result": {"rows": results, "columns": col_names},
+        "message": f"Query returned {len(results)} rows",
+    }
 
 
+@crud_op("get_records", readonly=True)
 def get_records(
+    cur,
     table_name: str,
     where_clause: Optional[str] = None,
     where_params: Optional[List[Any]] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
     order_by: Optional[str] = None,
+    fetch_size: int = DEFAULT_FETCH_SIZE,
+    as_dicts: bool = True,
+    columns: Optional[List[str]] = None,
 ) -> Dict:
     """
     Get records from a table with filtering and sorting.
     
+    Only the listed columns are read when `columns` is given, which cuts
+    transfer and conversion cost on wide tables.
+    
     Args:
         table_name: Name of the table
         where_clause: WHERE condition (use %s for parameters, e.g., "age > %s AND city = %s")
@@ -460,285 +592,523 @@ def get_records(
         limit: Maximum records to return
         offset: Number of records to skip
         order_by: ORDER BY clause (e.g., "name ASC, age DESC")
-        
+        fetch_size: Rows per round-trip when more than one batch may be returned
+        as_dicts: Return records as dicts; False returns value lists in 'columns' order
+        columns: Optional list of columns to return (default: all)
+    
     Returns:
         Result with matching records
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_where_clause(where_clause)
+    CRUDValidator.validate_limit_offset(limit, offset)
+    CRUDValidator.validate_order_by(order_by)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_where_clause(where_clause)
-        CRUDValidator.validate_limit_offset(limit, offset)
-        CRUDValidator.validate_order_by(order_by)
-        
-        query = f"SELECT * FROM {table_name}"
-        params = where_params or []
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        
-        if limit is not None:
-            query += f" LIMIT {limit}"
-        
-        if offset is not None:
-            query += f" OFFSET {offset}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
+    query = f"SELECT {_projection(columns)} FROM {table_name}"
+    params = where_params or []
+    
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    
+    if limit is not None:
+        query += f" LIMIT {limit}"
+    
+    if offset is not None:
+        query += f" OFFSET {offset}"
+    
+    if _uses_server_cursor(limit, fetch_size):
+        col_names, rows = _fetch_streamed(cur, query, params, fetch_size)
+    else:
         cur.execute(query, params)
         rows = cur.fetchall()
         col_names = [desc[0] for desc in cur.description]
-        
-        results = [dict(zip(col_names, row)) for row in rows]
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="get_records",
-            rows_affected=len(results),
-            duration_ms=duration,
-            result={"records": results, "columns": col_names},
-            message=f"Retrieved {len(results)} records from '{table_name}'"
-        )
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="get_records",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    results = _rows_to_dicts(col_names, rows) if as_dicts else rows
+    
+    return {
+        "rows_affected": len(results),
+        "result": {"records": results, "columns": col_names},
+        "message": f"Retrieved {len(results)} records from '{table_name}'",
+    }
+
+
+def _count_key(table_name: str, where_clause: Optional[str], params: List[Any]) -> Optional[Tuple]:
+    """Key of a count in _count_cache, None when the parameters are unhashable."""
+    key = (table_name, where_clause or "", tuple(params))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable parameter values (lists, dicts) are never cached
+        return None
+    return key
+
+
+def _cached_count(key: Optional[Tuple]) -> Optional[int]:
+    """Return a count cached less than COUNT_CACHE_TTL seconds ago."""
+    cached = _count_cache.get(key) if key is not None else None
+    if cached is not None and time.monotonic() - cached[1] < COUNT_CACHE_TTL:
+        return cached[0]
+    return None
+
+
+def _store_count(key: Optional[Tuple], count: int) -> None:
+    """Remember a freshly computed count."""
+    if key is None:
+        return
+    if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+        _count_cache.clear()
+    _count_cache[key] = (count, time.monotonic())
+
+
+def invalidate_counts() -> None:
+    """
+    Drop all cached counts (get_record_count and paginate_data totals).
+    
+    Operations in this module do it themselves; other modules call it
+    after committing writes to table data.
+    """
+    _count_cache.clear()
 
 
+@crud_op("get_record_count", autocommit=True)
 def get_record_count(
+    cur,
     table_name: str,
     where_clause: Optional[str] = None,
     where_params: Optional[List[Any]] = None,
+    exact: bool = True,
+    refresh_count: bool = False,
 ) -> Dict:
     """
     Count records in a table with optional filtering.
     
+    Exact counts scan the table, so they are reused for COUNT_CACHE_TTL
+    seconds for the same table and filter (shared with paginate_data);
+    result["cached"] tells whether the count was reused.
+    With exact=False and no filter the planner's row estimate from
+    pg_class.reltuples is returned instead - constant time, but only as
+    fresh as the last VACUUM/ANALYZE.
+    
     Args:
         table_name: Name of the table
         where_clause: Optional WHERE condition (e.g., "status = %s")
         where_params: List of values for WHERE clause
-        
+        exact: Set False to accept a statistics-based estimate (unfiltered counts only)
+        refresh_count: Recount even if a cached count is available
+    
     Returns:
         Result with record count
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_where_clause(where_clause)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_where_clause(where_clause)
-        
+    if not exact and not where_clause:
+        cur.execute("SELECT reltuples::BIGINT FROM pg_class WHERE oid = %s::regclass", [table_name])
+        estimate = cur.fetchone()[0]
+        # -1 means the table has never been vacuumed or analyzed
+        if estimate >= 0:
+            return {
+                "result": {"count": estimate, "estimated": True},
+                "message": f"Table '{table_name}' has approximately {estimate} records "
+                           "(planner estimate, may be stale)",
+            }
+    
+    params = where_params or []
+    count_key = _count_key(table_name, where_clause, params)
+    count = None if refresh_count else _cached_count(count_key)
+    cached = count is not None
+    
+    if not cached:
         query = f"SELECT COUNT(*) FROM {table_name}"
-        params = where_params or []
         
         if where_clause:
             query += f" WHERE {where_clause}"
         
-        conn = get_connection()
-        cur = conn.cursor()
-        
         cur.execute(query, params)
         count = cur.fetchone()[0]
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="get_record_count",
-            duration_ms=duration,
-            result={"count": count},
-            message=f"Table '{table_name}' has {count} records"
+        _store_count(count_key, count)
+    
+    return {
+        "result": {"count": count, "estimated": False, "cached": cached},
+        "message": f"Table '{table_name}' has {count} records",
+    }
+
+
+def _has_leading_index(cur, table_name: str, column_name: str) -> bool:
+    """Whether a btree index on the table starts with the column."""
+    cur.execute(
+        """
+        SELECT EXISTS (
+            SELECT 1
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_am am ON am.oid = c.relam
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+            WHERE i.indrelid = %s::regclass AND a.attname = %s AND am.amname = 'btree'
         )
+        """,
+        [table_name, column_name]
+    )
+    return cur.fetchone()[0]
+
+
+def _skip_scan_sql(table_name: str, column_name: str, limit: Optional[int]) -> str:
+    """
+    Build a loose index scan: one index probe per distinct value.
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="get_record_count",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
+    Each step takes the next value with ORDER BY ... LIMIT 1 rather than
+    MIN(), which does not exist for some btree-orderable types (boolean,
+    uuid). The walk skips NULLs, so a NULL row is appended when the column
+    has any, keeping the result identical to SELECT DISTINCT ... ORDER BY.
+    """
+    limit_clause = f" LIMIT {limit}" if limit else ""
+    return f"""
+        WITH RECURSIVE __skip AS (
+            SELECT (
+                SELECT {column_name} FROM {table_name}
+                WHERE {column_name} IS NOT NULL ORDER BY {column_name} LIMIT 1
+            ) AS __v
+            UNION ALL
+            SELECT (
+                SELECT {column_name} FROM {table_name}
+                WHERE {column_name} > __skip.__v ORDER BY {column_name} LIMIT 1
+            )
+            FROM __skip WHERE __skip.__v IS NOT NULL
         )
+        SELECT __v FROM (
+            (SELECT __v FROM __skip WHERE __v IS NOT NULL{limit_clause})
+            UNION ALL
+            SELECT NULL WHERE EXISTS (SELECT 1 FROM {table_name} WHERE {column_name} IS NULL)
+        ) AS __distinct
+        ORDER BY __v NULLS LAST{limit_clause}
+    """
 
 
+@crud_op("distinct_values", autocommit=True)
 def distinct_values(
+    cur,
     table_name: str,
     column_name: str,
     limit: Optional[int] = None,
+    use_index_skip: bool = False,
 ) -> Dict:
     """
     Get distinct values for a column.
     
+    SELECT DISTINCT reads and sorts the whole column. With use_index_skip
+    and a btree index leading on the column, the values are walked with a
+    recursive "loose index scan" instead, which is far cheaper when the
+    column has few distinct values (and slower when nearly all are
+    distinct). Without such an index the plain query is used.
+    
     Args:
         table_name: Name of the table
         column_name: Column to get distinct values from
         limit: Maximum values to return
-        
+        use_index_skip: Try the loose index scan for low-cardinality columns
+    
     Returns:
         Result with distinct values
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_column_name(column_name)
+    CRUDValidator.validate_limit_offset(limit, None)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_column_name(column_name)
-        CRUDValidator.validate_limit_offset(limit, None)
-        
+    if use_index_skip and _has_leading_index(cur, table_name, column_name):
+        query = _skip_scan_sql(table_name, column_name, limit)
+    else:
         query = f"SELECT DISTINCT {column_name} FROM {table_name} ORDER BY {column_name}"
         
         if limit:
             query += f" LIMIT {limit}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query)
-        values = [row[0] for row in cur.fetchall()]
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="distinct_values",
-            rows_affected=len(values),
-            duration_ms=duration,
-            result={"values": values, "count": len(values)},
-            message=f"Found {len(values)} distinct values in '{table_name}.{column_name}'"
-        )
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="distinct_values",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    cur.execute(query)
+    values = [row[0] for row in cur.fetchall()]
+    
+    return {
+        "rows_affected": len(values),
+        "result": {"values": values, "count": len(values)},
+        "message": f"Found {len(values)} distinct values in '{table_name}.{column_name}'",
+    }
 
 
+@crud_op("paginate_data", autocommit=True)
 def paginate_data(
+    cur,
     table_name: str,
     page: int = 1,
     page_size: int = 10,
     order_by: Optional[str] = None,
     where_clause: Optional[str] = None,
     where_params: Optional[List[Any]] = None,
+    cursor: Optional[Any] = None,
+    cursor_column: Optional[str] = None,
+    refresh_count: bool = False,
+    columns: Optional[List[str]] = None,
+    include_total: bool = True,
 ) -> Dict:
     """
     Get paginated records from a table.
     
+    Page-number pagination uses OFFSET, which makes the server read and
+    discard every row before the page - late pages on large tables get
+    slower linearly. Pass cursor_column to page by key instead: each page
+    starts right after `cursor` (the previous page's next_cursor).
+    
+    In offset mode the total count is reused for COUNT_CACHE_TTL seconds
+    for the same table and filter (writes made through this server clear
+    it); total_count_cached in the result tells whether it was reused.
+    
+    For large scans, combine keyset mode with a `columns` projection so
+    each page reads only the needed columns along an index.
+    
+    With include_total=False no count is taken at all: one extra row is
+    fetched to tell whether a next page exists, and total_records /
+    total_pages are None (enough for "load more" style paging).
+    
     Args:
         table_name: Name of the table
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored in keyset mode)
         page_size: Records per page
-        order_by: ORDER BY clause for consistent pagination
+        order_by: ORDER BY clause for consistent pagination (offset mode only)
         where_clause: Optional WHERE condition
         where_params: Parameters for WHERE clause
+        cursor: Last cursor_column value of the previous page (None for the first page)
+        cursor_column: Unique, indexed column to page by; enables keyset mode
+        refresh_count: Recount even if a cached total is available
+        columns: Optional list of columns to return (default: all)
+        include_total: Count the matching rows (offset mode only)
         
     Returns:
         Result with paginated records and metadata
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        
-        if not isinstance(page, int) or page < 1:
-            raise ValueError("Page must be a positive integer")
-        if not isinstance(page_size, int) or page_size < 1:
-            raise ValueError("Page size must be a positive integer")
-        
-        CRUDValidator.validate_where_clause(where_clause)
-        
-        # Calculate offset
-        offset = (page - 1) * page_size
-        
-        # Get total count
-        count_query = f"SELECT COUNT(*) FROM {table_name}"
-        params = where_params or []
-        if where_clause:
-            count_query += f" WHERE {where_clause}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(count_query, params)
-        total_count = cur.fetchone()[0]
-        
-        # Get paginated data
-        query = f"SELECT * FROM {table_name}"
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        query += f" LIMIT {page_size} OFFSET {offset}"
-        
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        col_names = [desc[0] for desc in cur.description]
-        
-        records = [dict(zip(col_names, row)) for row in rows]
-        
-        total_pages = (total_count + page_size - 1) // page_size
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="paginate_data",
-            rows_affected=len(records),
-            duration_ms=duration,
-            result={
-                "records": records,
-                "pagination": {
-                    "current_page": page,
-                    "page_size": page_size,
-                    "total_records": total_count,
-                    "total_pages": total_pages,
-                    "has_next": page < total_pages,
-                    "has_previous": page > 1,
-                }
-            },
-            message=f"Page {page} of {total_pages} ({len(records)} records)"
+    if not isinstance(page, int) or page < 1:
+        raise ValueError("Page must be a positive integer")
+    if not isinstance(page_size, int) or page_size < 1:
+        raise ValueError("Page size must be a positive integer")
+    
+    CRUDValidator.validate_where_clause(where_clause)
+    
+    if cursor_column is not None:
+        return _keyset_page(
+            cur, table_name, page_size, where_clause, where_params, cursor, cursor_column, order_by,
+            columns
         )
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="paginate_data",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
+    # Calculate offset
+    offset = (page - 1) * page_size
+    
+    if not include_total:
+        return _offset_page_without_total(
+            cur, table_name, page, page_size, offset, order_by, where_clause, where_params, columns
         )
+    
+    # Get total count (reused across pages of the same filter)
+    params = where_params or []
+    count_key = _count_key(table_name, where_clause, params)
+    cached_count = None if refresh_count else _cached_count(count_key)
+    
+    total_count_cached = cached_count is not None
+    
+    # Without a cached total, count in the same round-trip with a window
+    # function; it is appended as the last column of every row
+    projection = _projection(columns)
+    select_list = projection if total_count_cached else f"{projection}, COUNT(*) OVER() AS __total_count"
+    query = f"SELECT {select_list} FROM {table_name}"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    query += f" LIMIT {page_size} OFFSET {offset}"
+    
+    cur.execute(query, params)
+    rows = cur.fetchall()
+    col_names = [desc[0] for desc in cur.description]
+    
+    if total_count_cached:
+        total_count = cached_count
+    else:
+        col_names.pop()
+        if rows:
+            total_count = rows[0][-1]
+            rows = [row[:-1] for row in rows]
+        elif offset == 0:
+            # Nothing at offset 0 means nothing matches at all
+            total_count = 0
+        else:
+            # Empty page past the end: the window count is unavailable
+            count_query = f"SELECT COUNT(*) FROM {table_name}"
+            if where_clause:
+                count_query += f" WHERE {where_clause}"
+            
+            cur.execute(count_query, params)
+            total_count = cur.fetchone()[0]
+        
+        _store_count(count_key, total_count)
+    
+    records = _rows_to_dicts(col_names, rows)
+    
+    total_pages = (total_count + page_size - 1) // page_size
+    
+    return {
+        "rows_affected": len(records),
+        "result": {
+            "records": records,
+            "pagination": {
+                "current_page": page,
+                "page_size": page_size,
+                "total_records": total_count,
+                "total_pages": total_pages,
+                "has_next": page < total_pages,
+                "has_previous": page > 1,
+                "total_count_cached": total_count_cached,
+            }
+        },
+        "message": f"Page {page} of {total_pages} ({len(records)} records)",
+    }
+
+
+def _offset_page_without_total(
+    cur,
+    table_name: str,
+    page: int,
+    page_size: int,
+    offset: int,
+    order_by: Optional[str],
+    where_clause: Optional[str],
+    where_params: Optional[List[Any]],
+    columns: Optional[List[str]],
+) -> Dict:
+    """Fetch one OFFSET page, inferring has_next from one extra row instead of a count."""
+    query = f"SELECT {_projection(columns)} FROM {table_name}"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    query += f" LIMIT {page_size + 1} OFFSET {offset}"
+    
+    cur.execute(query, where_params or [])
+    rows = cur.fetchall()
+    col_names = [desc[0] for desc in cur.description]
+    
+    has_next = len(rows) > page_size
+    records = _rows_to_dicts(col_names, rows[:page_size])
+    
+    return {
+        "rows_affected": len(records),
+        "result": {
+            "records": records,
+            "pagination": {
+                "current_page": page,
+                "page_size": page_size,
+                "total_records": None,
+                "total_pages": None,
+                "has_next": has_next,
+                "has_previous": page > 1,
+                "total_count_cached": False,
+            }
+        },
+        "message": f"Page {page} ({len(records)} records)",
+    }
+
+
+def _keyset_page(
+    cur,
+    table_name: str,
+    page_size: int,
+    where_clause: Optional[str],
+    where_params: Optional[List[Any]],
+    cursor: Optional[Any],
+    cursor_column: str,
+    order_by: Optional[str],
+    columns: Optional[List[str]] = None,
+) -> Dict:
+    """Fetch one page ordered by cursor_column, starting after `cursor`."""
+    CRUDValidator.validate_column_name(cursor_column)
+    if order_by:
+        raise ValueError(
+            "order_by cannot be combined with cursor_column; keyset pages are ordered by cursor_column"
+        )
+    
+    conditions = []
+    params = list(where_params or [])
+    if where_clause:
+        conditions.append(f"({where_clause})")
+    if cursor is not None:
+        conditions.append(f"{cursor_column} > %s")
+        params.append(cursor)
+    
+    # next_cursor is read from the page, so the cursor column is always selected
+    if columns and cursor_column.lower() not in [col.lower() for col in columns]:
+        columns = list(columns) + [cursor_column]
+    
+    query = f"SELECT {_projection(columns)} FROM {table_name}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    # One extra row tells whether another page follows
+    query += f" ORDER BY {cursor_column} ASC LIMIT {page_size + 1}"
+    
+    cur.execute(query, params)
+    rows = cur.fetchall()
+    col_names = [desc[0] for desc in cur.description]
+    
+    has_next = len(rows) > page_size
+    records = _rows_to_dicts(col_names, rows[:page_size])
+    # Unquoted identifiers come back folded to lower case
+    next_cursor = records[-1][cursor_column.lower()] if has_next else None
+    
+    return {
+        "rows_affected": len(records),
+        "result": {
+            "records": records,
+            "pagination": {
+                "page_size": page_size,
+                "cursor_column": cursor_column,
+                "cursor": cursor,
+                "next_cursor": next_cursor,
+                "has_next": has_next,
+                "has_previous": cursor is not None,
+            }
+        },
+        "message": f"Keyset page by '{cursor_column}' ({len(records)} records)",
+    }
+
+
+def _returning_clause(returning: Optional[List[str]]) -> str:
+    """Build a RETURNING clause for the given columns ("*" for all), or ''."""
+    if not returning:
+        return ""
+    if returning != ["*"]:
+        for col in returning:
+            CRUDValidator.validate_column_name(col)
+    return f" RETURNING {', '.join(returning)}"
+
+
+def _returned_rows(cur) -> Optional[Dict[str, List]]:
+    """Collect rows produced by a RETURNING clause, None when there was none."""
+    if cur.description is None:
+        return None
+    col_names = [desc[0] for desc in cur.description]
+    return {"returned": _rows_to_dicts(col_names, cur.fetchall())}
 
 
 # ============================================
 # UPDATE OPERATIONS
 # ============================================
 
+@crud_op("update_record", modifies_data=True)
 def update_record(
+    cur,
     table_name: str,
     record_id: Any,
     id_column: str,
     values: Dict[str, Any],
+    returning: Optional[List[str]] = None,
 ) -> Dict:
     """
     Update a single record by ID.
@@ -748,66 +1118,48 @@ def update_record(
         record_id: Value of the ID column
         id_column: Name of the ID column (usually 'id')
         values: Dictionary of column_name: new_value pairs
-        
+        returning: Optional columns (or ["*"]) of the updated row to return
+                   under result["returned"], saving a follow-up SELECT
+    
     Returns:
         Result of update operation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_column_name(id_column)
+    CRUDValidator.validate_values_dict(values)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_column_name(id_column)
-        CRUDValidator.validate_values_dict(values)
-        
-        # Build UPDATE query
-        set_clause = ','.join([f"{col}=%s" for col in values.keys()])
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {id_column}=%s"
-        
-        # Prepare values list
-        param_values = list(values.values()) + [record_id]
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query, param_values)
-        conn.commit()
-        
-        rows_affected = cur.rowcount
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        if rows_affected == 0:
-            return _format_result(
-                status="warning",
-                operation="update_record",
-                duration_ms=duration,
-                message=f"No records found with {id_column}={record_id}"
-            )
-        
-        return _format_result(
-            status="success",
-            operation="update_record",
-            rows_affected=rows_affected,
-            duration_ms=duration,
-            message=f"Updated {rows_affected} record(s) in '{table_name}'"
-        )
+    # Build UPDATE query (cached per column signature)
+    columns = tuple(values)
+    query = _update_sql(table_name, columns, f"{id_column}=%s") + _returning_clause(returning)
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="update_record",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    # Prepare values list
+    param_values = [values[col] for col in columns] + [record_id]
+    
+    cur.execute(query, param_values)
+    
+    rows_affected = cur.rowcount
+    
+    if rows_affected == 0:
+        return {
+            "status": "warning",
+            "message": f"No records found with {id_column}={record_id}",
+        }
+    
+    return {
+        "rows_affected": rows_affected,
+        "result": _returned_rows(cur),
+        "message": f"Updated {rows_affected} record(s) in '{table_name}'",
+    }
 
 
+@crud_op("update_records_batch", modifies_data=True)
 def update_records_batch(
+    cur,
     table_name: str,
     where_clause: str,
     where_params: List[Any],
     values: Dict[str, Any],
+    returning: Optional[List[str]] = None,
 ) -> Dict:
     """
     Update multiple records matching a WHERE clause.
@@ -817,57 +1169,100 @@ def update_records_batch(
         where_clause: WHERE condition (e.g., "age > %s AND city = %s")
         where_params: Values for WHERE clause
         values: Dictionary of column_name: new_value pairs to update
-        
+        returning: Optional columns (or ["*"]) of the updated rows to return
+                   under result["returned"]
+    
     Returns:
         Result with number of updated records
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_where_clause(where_clause)
+    CRUDValidator.validate_values_dict(values)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_where_clause(where_clause)
-        CRUDValidator.validate_values_dict(values)
-        
-        # Build UPDATE query
-        set_clause = ','.join([f"{col}=%s" for col in values.keys()])
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
-        
-        # Prepare parameters: update values + where params
-        params = list(values.values()) + where_params
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query, params)
-        conn.commit()
-        
-        rows_affected = cur.rowcount
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        status = "success" if rows_affected > 0 else "warning"
-        msg = f"Updated {rows_affected} record(s)" if rows_affected > 0 else "No records matched WHERE clause"
-        
-        return _format_result(
-            status=status,
-            operation="update_records_batch",
-            rows_affected=rows_affected,
-            duration_ms=duration,
-            message=msg
-        )
+    # Build UPDATE query (cached per column signature and filter)
+    columns = tuple(values)
+    query = _update_sql(table_name, columns, where_clause) + _returning_clause(returning)
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="update_records_batch",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    # Prepare parameters: update values + where params
+    params = [values[col] for col in columns] + list(where_params)
+    
+    cur.execute(query, params)
+    
+    rows_affected = cur.rowcount
+    
+    status = "success" if rows_affected > 0 else "warning"
+    msg = f"Updated {rows_affected} record(s)" if rows_affected > 0 else "No records matched WHERE clause"
+    
+    return {
+        "status": status,
+        "rows_affected": rows_affected,
+        "result": _returned_rows(cur),
+        "message": msg,
+    }
 
 
+@crud_op("update_records_bulk", modifies_data=True)
+def update_records_bulk(
+    cur,
+    table_name: str,
+    key_column: str,
+    rows: List[Dict[str, Any]],
+) -> Dict:
+    """
+    Update many records by key, each with its own values, in one statement per page.
+    
+    Args:
+        table_name: Name of the table
+        key_column: Column identifying each record (usually 'id')
+        rows: Dictionaries with identical keys, each including key_column
+    
+    Returns:
+        Result with number of updated records
+    """
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_column_name(key_column)
+    CRUDValidator.validate_values_list(rows)
+    
+    first = rows[0]
+    CRUDValidator.validate_values_dict(first)
+    if key_column not in first:
+        raise ValueError(f"Every row must include the key column '{key_column}'")
+    if len(first) < 2:
+        raise ValueError("Rows must include at least one column to update besides the key")
+    
+    # Key column first so the VALUES alias lines up with the SET list
+    columns = (key_column,) + tuple(col for col in first if col != key_column)
+    query = _bulk_update_sql(table_name, key_column, columns)
+    template = _values_template(cur, table_name, columns)
+    
+    values_tuples = [
+        tuple(row[col] for col in columns)
+        for row in rows
+    ]
+    
+    # One execute per page so rowcount can be summed across pages
+    rows_affected = 0
+    for start in range(0, len(values_tuples), BATCH_PAGE_SIZE):
+        page = values_tuples[start:start + BATCH_PAGE_SIZE]
+        execute_values(cur, query, page, template=template, page_size=len(page))
+        rows_affected += cur.rowcount
+    
+    if rows_affected == 0:
+        return {
+            "status": "warning",
+            "rows_affected": 0,
+            "message": f"No records matched the given {key_column} values",
+        }
+    
+    return {
+        "rows_affected": rows_affected,
+        "message": f"Updated {rows_affected} record(s) in '{table_name}'",
+    }
+
+
+@crud_op("update_column", modifies_data=True)
 def update_column(
+    cur,
     table_name: str,
     column_name: str,
     new_value: Any,
@@ -883,107 +1278,63 @@ def update_column(
         new_value: New value for the column
         where_clause: Optional WHERE condition (if None, updates ALL records!)
         where_params: Parameters for WHERE clause
-        
+    
     Returns:
         Result with number of updated records
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_column_name(column_name)
+    CRUDValidator.validate_where_clause(where_clause)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_column_name(column_name)
-        CRUDValidator.validate_where_clause(where_clause)
-        
-        if not where_clause:
-            # Warn about updating all records
-            warnings_list = ["WARNING: No WHERE clause specified - will update ALL records in table!"]
-        else:
-            warnings_list = []
-        
-        query = f"UPDATE {table_name} SET {column_name}=%s"
-        params = [new_value]
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-            params.extend(where_params or [])
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query, params)
-        conn.commit()
-        
-        rows_affected = cur.rowcount
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="update_column",
-            rows_affected=rows_affected,
-            duration_ms=duration,
-            message=f"Updated {rows_affected} record(s)",
-            warnings=warnings_list
-        )
+    if not where_clause:
+        # Warn about updating all records
+        warnings_list = ["WARNING: No WHERE clause specified - will update ALL records in table!"]
+    else:
+        warnings_list = []
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="update_column",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    query = f"UPDATE {table_name} SET {column_name}=%s"
+    params = [new_value]
+    
+    if where_clause:
+        query += f" WHERE {where_clause}"
+        params.extend(where_params or [])
+    
+    cur.execute(query, params)
+    
+    rows_affected = cur.rowcount
+    
+    return {
+        "rows_affected": rows_affected,
+        "message": f"Updated {rows_affected} record(s)",
+        "warnings": warnings_list,
+    }
 
 
-def rename_table(old_name: str, new_name: str) -> Dict:
+@crud_op("rename_table", invalidates_schema=True, autocommit=True)
+def rename_table(cur, old_name: str, new_name: str) -> Dict:
     """
     Rename a table safely.
     
     Args:
         old_name: Current table name
         new_name: New table name
-        
+    
     Returns:
         Result of rename operation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(old_name)
+    CRUDValidator.validate_table_name(new_name)
     
-    try:
-        CRUDValidator.validate_table_name(old_name)
-        CRUDValidator.validate_table_name(new_name)
-        
-        query = f"ALTER TABLE {old_name} RENAME TO {new_name}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="rename_table",
-            duration_ms=duration,
-            message=f"Table '{old_name}' renamed to '{new_name}'"
-        )
+    query = f"ALTER TABLE {old_name} RENAME TO {new_name}"
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="rename_table",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    cur.execute(query)
+    
+    return {"message": f"Table '{old_name}' renamed to '{new_name}'"}
 
 
+@crud_op("rename_column", invalidates_schema=True, autocommit=True)
 def rename_column(
+    cur,
     table_name: str,
     old_column: str,
     new_column: str,
@@ -995,54 +1346,32 @@ def rename_column(
         table_name: Name of the table
         old_column: Current column name
         new_column: New column name
-        
+    
     Returns:
         Result of rename operation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_column_name(old_column)
+    CRUDValidator.validate_column_name(new_column)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_column_name(old_column)
-        CRUDValidator.validate_column_name(new_column)
-        
-        query = f"ALTER TABLE {table_name} RENAME COLUMN {old_column} TO {new_column}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        return _format_result(
-            status="success",
-            operation="rename_column",
-            duration_ms=duration,
-            message=f"Column '{old_column}' renamed to '{new_column}' in '{table_name}'"
-        )
+    query = f"ALTER TABLE {table_name} RENAME COLUMN {old_column} TO {new_column}"
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="rename_column",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    cur.execute(query)
+    
+    return {"message": f"Column '{old_column}' renamed to '{new_column}' in '{table_name}'"}
 
 
 # ============================================
 # DELETE OPERATIONS
 # ============================================
 
+@crud_op("delete_record", modifies_data=True)
 def delete_record(
+    cur,
     table_name: str,
     record_id: Any,
     id_column: str,
+    returning: Optional[List[str]] = None,
 ) -> Dict:
     """
     Delete a single record by ID.
@@ -1051,163 +1380,219 @@ def delete_record(
         table_name: Name of the table
         record_id: Value of the ID column
         id_column: Name of the ID column (usually 'id')
-        
+        returning: Optional columns (or ["*"]) of the deleted row to return
+                   under result["returned"]
+    
     Returns:
         Result of delete operation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_column_name(id_column)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_column_name(id_column)
-        
-        query = f"DELETE FROM {table_name} WHERE {id_column}=%s"
-        
-        conn = get_connection()
-        cur = conn.cursor()
+    query = f"DELETE FROM {table_name} WHERE {id_column}=%s" + _returning_clause(returning)
+    
+    cur.execute(query, [record_id])
+    
+    rows_affected = cur.rowcount
+    
+    if rows_affected == 0:
+        return {
+            "status": "warning",
+            "message": f"No records found with {id_column}={record_id}",
+        }
+    
+    return {
+        "rows_affected": rows_affected,
+        "result": _returned_rows(cur),
+        "message": f"Deleted {rows_affected} record(s) from '{table_name}'",
+    }
+
+
+@crud_op("delete_records", modifies_data=True)
+def _delete_records(
+    cur,
+    table_name: str,
+    where_clause: str,
+    where_params: List[Any],
+    returning: Optional[List[str]] = None,
+    chunk_size: Optional[int] = None,
+    id_column: str = "id",
+) -> Dict:
+    """Run delete_records() on the operation's cursor."""
+    CRUDValidator.validate_table_name(table_name)
+    CRUDValidator.validate_where_clause(where_clause)
+    
+    if chunk_size is None:
+        query = f"DELETE FROM {table_name} WHERE {where_clause}" + _returning_clause(returning)
         
-        cur.execute(query, [record_id])
-        conn.commit()
+        cur.execute(query, where_params)
         
         rows_affected = cur.rowcount
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        if rows_affected == 0:
-            return _format_result(
-                status="warning",
-                operation="delete_record",
-                duration_ms=duration,
-                message=f"No records found with {id_column}={record_id}"
-            )
-        
-        return _format_result(
-            status="success",
-            operation="delete_record",
-            rows_affected=rows_affected,
-            duration_ms=duration,
-            message=f"Deleted {rows_affected} record(s) from '{table_name}'"
+        result = _returned_rows(cur)
+    else:
+        rows_affected, result, error = _delete_in_chunks(
+            cur, table_name, where_clause, where_params, returning, chunk_size, id_column
         )
+        if error is not None:
+            return {
+                "status": "error",
+                "rows_affected": rows_affected,
+                "result": result,
+                "message": f"Chunked delete failed after {rows_affected} record(s) were deleted: {error}",
+                "warnings": [
+                    f"Partial deletion: {rows_affected} record(s) deleted by earlier chunks stay deleted"
+                ],
+            }
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="delete_record",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    status = "success" if rows_affected > 0 else "warning"
+    msg = f"Deleted {rows_affected} record(s)" if rows_affected > 0 else "No records matched WHERE clause"
+    
+    return {
+        "status": status,
+        "rows_affected": rows_affected,
+        "result": result,
+        "message": msg,
+    }
 
 
 def delete_records(
     table_name: str,
     where_clause: str,
     where_params: List[Any],
+    returning: Optional[List[str]] = None,
+    chunk_size: Optional[int] = None,
+    id_column: str = "id",
+    conn=None,
 ) -> Dict:
     """
     Delete multiple records matching a WHERE clause.
     
+    A single DELETE holds its row locks and writes all of its WAL in one
+    transaction. With chunk_size the matching rows are deleted at most
+    chunk_size at a time (in id_column order) and each chunk is committed
+    on its own, keeping locks short for concurrent writers. The deletion
+    is then no longer atomic, so chunk_size cannot be combined with conn=
+    (it would commit the enclosing transaction() partway through). If a
+    later chunk fails, the error result still carries the rows_affected
+    (and returned rows) of the chunks already committed, with a warning
+    that the deletion is partial.
+    
     Args:
         table_name: Name of the table
         where_clause: WHERE condition (e.g., "status = %s AND age < %s")
         where_params: Values for WHERE clause
-        
+        returning: Optional columns (or ["*"]) of the deleted rows to return
+                   under result["returned"]
+        chunk_size: Optional maximum rows deleted per committed chunk
+        id_column: Unique column used to pick each chunk (chunked mode only)
+        conn: Optional connection from transaction() to run the delete in
+    
     Returns:
         Result with number of deleted records
     """
-    start = time.time()
+    if chunk_size is not None and conn is not None:
+        raise ValueError("chunk_size commits each chunk and cannot be used inside a transaction")
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        CRUDValidator.validate_where_clause(where_clause)
-        
-        query = f"DELETE FROM {table_name} WHERE {where_clause}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query, where_params)
-        conn.commit()
-        
-        rows_affected = cur.rowcount
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        status = "success" if rows_affected > 0 else "warning"
-        msg = f"Deleted {rows_affected} record(s)" if rows_affected > 0 else "No records matched WHERE clause"
-        
-        return _format_result(
-            status=status,
-            operation="delete_records",
-            rows_affected=rows_affected,
-            duration_ms=duration,
-            message=msg
-        )
+    return _delete_records(
+        table_name, where_clause, where_params, returning, chunk_size, id_column, conn=conn
+    )
+
+
+def _delete_in_chunks(
+    cur,
+    table_name: str,
+    where_clause: str,
+    where_params: List[Any],
+    returning: Optional[List[str]],
+    chunk_size: int,
+    id_column: str,
+) -> Tuple[int, Optional[Dict[str, List]], Optional[Exception]]:
+    """
+    Delete matching rows chunk_size at a time, committing after each chunk.
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="delete_records",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    Returns:
+        (committed row count, returned rows, error). If a chunk fails after
+        earlier chunks were committed, the error is returned alongside the
+        committed totals instead of raised; a failing first chunk raises.
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    CRUDValidator.validate_column_name(id_column)
+    
+    query = (
+        f"DELETE FROM {table_name} WHERE {id_column} IN ("
+        f"SELECT {id_column} FROM {table_name} WHERE {where_clause} "
+        f"ORDER BY {id_column} LIMIT %s)"
+    ) + _returning_clause(returning)
+    params = list(where_params) + [chunk_size]
+    
+    rows_affected = 0
+    returned = [] if returning else None
+    error = None
+    while True:
+        try:
+            cur.execute(query, params)
+            deleted = cur.rowcount
+            chunk_returned = _returned_rows(cur)["returned"] if returned is not None else None
+            cur.connection.commit()
+        except Exception as e:
+            if not rows_affected:
+                raise
+            # Earlier chunks are already committed and cannot be undone
+            cur.connection.rollback()
+            error = e
+            break
+        rows_affected += deleted
+        if returned is not None:
+            returned.extend(chunk_returned)
+        if deleted < chunk_size:
+            break
+    
+    return rows_affected, (None if returned is None else {"returned": returned}), error
 
 
-def truncate_table(table_name: str) -> Dict:
+@crud_op("truncate_table", modifies_data=True, autocommit=True)
+def truncate_table(
+    cur,
+    table_name: str,
+    restart_identity: bool = False,
+    cascade: bool = False,
+) -> Dict:
     """
     Truncate (clear all data from) a table. Much faster than DELETE for large tables.
     WARNING: This deletes all data! Cannot be rolled back in autocommit mode.
     
     Args:
         table_name: Name of the table to truncate
-        
+        restart_identity: Also reset sequences owned by the table's columns
+        cascade: Also truncate tables that reference this one by foreign key
+    
     Returns:
         Result of truncate operation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        
-        query = f"TRUNCATE TABLE {table_name}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        warnings_list = [
-            "WARNING: TRUNCATE deleted all data from table!",
-            "This operation cannot be rolled back in some configurations."
-        ]
-        
-        return _format_result(
-            status="success",
-            operation="truncate_table",
-            duration_ms=duration,
-            message=f"Truncated table '{table_name}' - all data deleted",
-            warnings=warnings_list
-        )
+    query = f"TRUNCATE TABLE {table_name}"
+    if restart_identity:
+        query += " RESTART IDENTITY"
+    if cascade:
+        query += " CASCADE"
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="truncate_table",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    cur.execute(query)
+    
+    warnings_list = [
+        "WARNING: TRUNCATE deleted all data from table!",
+        "This operation cannot be rolled back in some configurations."
+    ]
+    
+    return {
+        "message": f"Truncated table '{table_name}' - all data deleted",
+        "warnings": warnings_list,
+    }
 
 
-def drop_table(table_name: str, cascade: bool = False) -> Dict:
+@crud_op("drop_table", invalidates_schema=True, autocommit=True)
+def drop_table(cur, table_name: str, cascade: bool = False, if_exists: bool = False) -> Dict:
     """
     Drop (delete) a table from the database.
     WARNING: This is permanent and deletes the entire table structure and data!
@@ -1215,46 +1600,32 @@ def drop_table(table_name: str, cascade: bool = False) -> Dict:
     Args:
         table_name: Name of the table to drop
         cascade: If True, also drop dependent objects (views, indexes, etc.)
-        
+        if_exists: Succeed without error when the table does not exist
+    
     Returns:
         Result of drop operation
     """
-    start = time.time()
+    CRUDValidator.validate_table_name(table_name)
     
-    try:
-        CRUDValidator.validate_table_name(table_name)
-        
-        cascade_str = "CASCADE" if cascade else "RESTRICT"
-        query = f"DROP TABLE {table_name} {cascade_str}"
-        
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute(query)
-        conn.commit()
-        
-        duration = (time.time() - start) * 1000
-        
-        cur.close()
-        conn.close()
-        
-        warnings_list = [
-            f"CRITICAL: Table '{table_name}' has been permanently dropped!",
-            "This operation cannot be undone."
-        ]
-        
-        return _format_result(
-            status="success",
-            operation="drop_table",
-            duration_ms=duration,
-            message=f"Table '{table_name}' dropped",
-            warnings=warnings_list
-        )
+    if if_exists:
+        cur.execute("SELECT to_regclass(%s) IS NOT NULL", [table_name])
+        if not cur.fetchone()[0]:
+            return {
+                "message": f"Table '{table_name}' did not exist, nothing dropped",
+            }
     
-    except Exception as e:
-        return _format_result(
-            status="error",
-            operation="drop_table",
-            duration_ms=(time.time() - start) * 1000,
-            message=str(e)
-        )
+    cascade_str = "CASCADE" if cascade else "RESTRICT"
+    if_exists_str = "IF EXISTS " if if_exists else ""
+    query = f"DROP TABLE {if_exists_str}{table_name} {cascade_str}"
+    
+    cur.execute(query)
+    
+    warnings_list = [
+        f"CRITICAL: Table '{table_name}' has been permanently dropped!",
+        "This operation cannot be undone."
+    ]
+    
+    return {
+        "message": f"Table '{table_name}' dropped",
+        "warnings": warnings_list,
+    }
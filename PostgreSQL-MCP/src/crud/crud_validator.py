@@ -3,9 +3,69 @@ Validation module for CRUD operations.
 Ensures input safety and data integrity before database operations.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import re
 
+# Common SQL injection patterns rejected in WHERE clauses, folded into one
+# alternation so a clause is scanned once rather than once per pattern
+DANGEROUS_WHERE_PATTERN = re.compile(
+    r";\s*(?:DROP|DELETE|TRUNCATE|CREATE)"
+    r"|--\s*$"  # SQL comments at end
+    r"|/\*",    # Block comments
+    re.IGNORECASE,
+)
+
+# Statement separators and comments rejected anywhere in ORDER BY
+FORBIDDEN_ORDER_BY_PATTERN = re.compile(r";|--|/\*")
+
+# PostgreSQL reserved keywords (common ones) rejected as table names
+RESERVED_KEYWORDS = frozenset({
+    "select", "from", "where", "insert", "update", "delete", "create", 
+    "drop", "alter", "table", "view", "index", "schema", "database"
+})
+
+# Base column types accepted by validate_column_type
+VALID_COLUMN_TYPES = frozenset({
+    # Numeric
+    "SMALLINT", "INTEGER", "BIGINT", "DECIMAL", "NUMERIC", "REAL", "DOUBLE PRECISION",
+    "SERIAL", "BIGSERIAL",
+    # String
+    "CHARACTER", "CHAR", "VARCHAR", "TEXT",
+    # Date/Time
+    "DATE", "TIME", "TIMESTAMP", "INTERVAL",
+    # Boolean
+    "BOOLEAN",
+    # Binary
+    "BYTEA",
+    # JSON
+    "JSON", "JSONB",
+    # UUID
+    "UUID",
+    # Arrays
+    "ARRAY",
+})
+
+# Referential actions accepted for ON DELETE / ON UPDATE
+FOREIGN_KEY_ACTIONS = frozenset({"RESTRICT", "CASCADE", "SET NULL", "SET DEFAULT", "NO ACTION"})
+
+
+@lru_cache(maxsize=4096)
+def is_valid_identifier(name: str) -> bool:
+    """
+    Check an unquoted identifier: letter/underscore, then alphanumerics/underscores (memoized).
+    
+    For ASCII strings str.isidentifier() accepts exactly [A-Za-z_][A-Za-z0-9_]*,
+    and runs as a C loop without the regex engine.
+    """
+    return name.isascii() and name.isidentifier()
+
+
+@lru_cache(maxsize=4096)
+def is_safe_where_clause(where_clause: str) -> bool:
+    """Check a WHERE clause for common SQL injection patterns (memoized)."""
+    return DANGEROUS_WHERE_PATTERN.search(where_clause) is None
+
 
 class CRUDValidator:
     """Validates inputs for CRUD operations."""
@@ -27,19 +87,14 @@ class CRUDValidator:
         if not table_name or not isinstance(table_name, str):
             raise ValueError("Table name must be a non-empty string")
         
-        # PostgreSQL identifier rules: start with letter/underscore, then alphanumeric/underscore
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", table_name):
+        if not is_valid_identifier(table_name):
             raise ValueError(
                 f"Invalid table name '{table_name}'. Must start with letter or underscore, "
                 "contain only alphanumeric characters and underscores."
             )
         
         # Check for PostgreSQL reserved keywords (common ones)
-        reserved = {
-            "select", "from", "where", "insert", "update", "delete", "create", 
-            "drop", "alter", "table", "view", "index", "schema", "database"
-        }
-        if table_name.lower() in reserved:
+        if table_name.lower() in RESERVED_KEYWORDS:
             raise ValueError(f"'{table_name}' is a PostgreSQL reserved keyword")
         
         return True
@@ -50,7 +105,7 @@ class CRUDValidator:
         if not column_name or not isinstance(column_name, str):
             raise ValueError("Column name must be a non-empty string")
         
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", column_name):
+        if not is_valid_identifier(column_name):
             raise ValueError(
                 f"Invalid column name '{column_name}'. Must start with letter or underscore, "
                 "contain only alphanumeric characters and underscores."
@@ -75,29 +130,9 @@ class CRUDValidator:
         # Extract base type
         base_type = data_type.split('(')[0].upper().strip()
         
-        valid_types = {
-            # Numeric
-            "SMALLINT", "INTEGER", "BIGINT", "DECIMAL", "NUMERIC", "REAL", "DOUBLE PRECISION",
-            "SERIAL", "BIGSERIAL",
-            # String
-            "CHARACTER", "CHAR", "VARCHAR", "TEXT",
-            # Date/Time
-            "DATE", "TIME", "TIMESTAMP", "INTERVAL",
-            # Boolean
-            "BOOLEAN",
-            # Binary
-            "BYTEA",
-            # JSON
-            "JSON", "JSONB",
-            # UUID
-            "UUID",
-            # Arrays
-            "ARRAY",
-        }
-        
-        if base_type not in valid_types:
+        if base_type not in VALID_COLUMN_TYPES:
             raise ValueError(
-                f"Unknown data type '{data_type}'. Valid types: {', '.join(sorted(valid_types))}"
+                f"Unknown data type '{data_type}'. Valid types: {', '.join(sorted(VALID_COLUMN_TYPES))}"
             )
         
         return True
@@ -120,21 +155,11 @@ class CRUDValidator:
             raise ValueError("WHERE clause must be a string")
         
         # Check for common SQL injection patterns
-        dangerous_patterns = [
-            r";\s*DROP",
-            r";\s*DELETE",
-            r";\s*TRUNCATE",
-            r";\s*CREATE",
-            r"--\s*$",  # SQL comments at end
-            r"/\*",     # Block comments
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, where_clause, re.IGNORECASE):
-                raise ValueError(
-                    "WHERE clause contains potentially dangerous SQL. "
-                    "Only use simple filtering conditions."
-                )
+        if not is_safe_where_clause(where_clause):
+            raise ValueError(
+                "WHERE clause contains potentially dangerous SQL. "
+                "Only use simple filtering conditions."
+            )
         
         return True
 
@@ -178,15 +203,18 @@ class CRUDValidator:
         if not records:
             raise ValueError("Records list must not be empty")
         
-        # All records must have same structure
-        first_keys = set(records[0].keys())
+        # Column names are validated once; every other record must have the
+        # same keys, compared as dict views without building a set per row
+        CRUDValidator.validate_values_dict(records[0])
+        first_keys = records[0].keys()
         for i, record in enumerate(records[1:], 1):
-            if set(record.keys()) != first_keys:
+            if not isinstance(record, dict):
+                raise ValueError(f"Record {i} must be a dictionary")
+            if record.keys() != first_keys:
                 raise ValueError(
                     f"Record {i} has different columns than first record. "
                     f"All records must have identical column structure."
                 )
-            CRUDValidator.validate_values_dict(record)
         
         return True
 
@@ -208,7 +236,7 @@ class CRUDValidator:
             raise ValueError("ORDER BY clause must be a string")
         
         # Check for dangerous SQL
-        if ";" in order_by or "--" in order_by or "/*" in order_by:
+        if FORBIDDEN_ORDER_BY_PATTERN.search(order_by):
             raise ValueError("ORDER BY clause contains forbidden characters")
         
         return True
@@ -279,10 +307,9 @@ class CRUDValidator:
         CRUDValidator.validate_table_name(ref_table)
         CRUDValidator.validate_column_name(ref_column)
         
-        valid_actions = {"RESTRICT", "CASCADE", "SET NULL", "SET DEFAULT", "NO ACTION"}
-        if on_delete.upper() not in valid_actions:
+        if on_delete.upper() not in FOREIGN_KEY_ACTIONS:
             raise ValueError(f"Invalid ON DELETE action: {on_delete}")
-        if on_update.upper() not in valid_actions:
+        if on_update.upper() not in FOREIGN_KEY_ACTIONS:
             raise ValueError(f"Invalid ON UPDATE action: {on_update}")
         
         return True
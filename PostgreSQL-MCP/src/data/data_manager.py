@@ -6,9 +6,12 @@ Phase 4B: search_data, find_duplicates, validate_foreign_keys
 
 import time
 import csv
+import io
 import json
 import os
-from typing import Dict, List, Optional, Any, Union
+import tempfile
+from typing import Dict, List, Optional, Any, Tuple, Union
+from src.crud import invalidate_counts
 from src.database import get_connection
 
 
@@ -85,11 +88,16 @@ def export_data(
         if limit:
             query += f" LIMIT {limit}"
         
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
+        if format.lower() == "csv":
+            # COPY renders the CSV server-side; rows never become Python tuples
+            columns, row_count, output = _copy_to_csv(cursor, query, output_path)
+        else:
+            cursor.execute(query)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            row_count = len(rows)
         
-        if not rows:
+        if not row_count:
             return _format_result(
                 status="success",
                 operation="export_data",
@@ -99,9 +107,7 @@ def export_data(
             )
         
         # Export based on format
-        if format.lower() == "csv":
-            output = _export_to_csv(columns, rows, output_path)
-        elif format.lower() == "json":
+        if format.lower() == "json":
             output = _export_to_json(columns, rows, output_path)
         elif format.lower() == "sql":
             output = _export_to_sql(table_name, columns, rows, output_path)
@@ -111,22 +117,22 @@ def export_data(
         result = {
             "table": table_name,
             "format": format,
-            "rows_exported": len(rows),
+            "rows_exported": row_count,
             "columns": columns
         }
         
         if output_path:
             result["file_path"] = output_path
             result["file_size_bytes"] = os.path.getsize(output_path) if os.path.exists(output_path) else 0
-            message = f"Exported {len(rows)} rows to {output_path}"
+            message = f"Exported {row_count} rows to {output_path}"
         else:
             result["data"] = output
-            message = f"Exported {len(rows)} rows as {format}"
+            message = f"Exported {row_count} rows as {format}"
         
         return _format_result(
             status="success",
             operation="export_data",
-            rows_affected=len(rows),
+            rows_affected=row_count,
             duration_ms=duration_ms,
             result=result,
             message=message,
@@ -143,22 +149,39 @@ def export_data(
         )
 
 
-def _export_to_csv(columns: List[str], rows: List[tuple], output_path: Optional[str]) -> str:
-    """Helper function to export data to CSV format."""
+def _copy_to_csv(cursor, query: str, output_path: Optional[str]) -> Tuple[List[str], int, str]:
+    """
+    Helper function to export a query to CSV format with COPY ... TO STDOUT.
+    
+    A file export is written to a temporary file next to output_path and
+    only moved into place once the COPY succeeded with at least one row;
+    otherwise an existing file at output_path is left untouched.
+    """
+    # Zero-row probe for the column names (COPY output carries no description)
+    cursor.execute(f"SELECT * FROM ({query}) AS export LIMIT 0")
+    columns = [desc[0] for desc in cursor.description]
+    
+    copy_sql = f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)"
     if output_path:
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(columns)
-            writer.writerows(rows)
-        return output_path
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(output_path)), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+                cursor.copy_expert(copy_sql, f)
+            if cursor.rowcount > 0:
+                # mkstemp creates the file owner-only; keep the usual export permissions
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return columns, cursor.rowcount, output_path
     else:
         # Return CSV as string
-        import io
         output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(columns)
-        writer.writerows(rows)
-        return output.getvalue()
+        cursor.copy_expert(copy_sql, output)
+        return columns, cursor.rowcount, output.getvalue()
 
 
 def _export_to_json(columns: List[str], rows: List[tuple], output_path: Optional[str]) -> Union[str, List[Dict]]:
@@ -353,6 +376,7 @@ def import_data(
                     errors.append(f"Row {idx + 1}: {str(e)}")
         
         conn.commit()
+        invalidate_counts()
         
         duration_ms = (time.time() - start_time) * 1000
         
@@ -1,5 +1,5 @@
 """Database module for SchemaIntelligence"""
 
-from .connection import get_connection
+from .connection import get_connection, get_pooled_connection, release_connection, pg_cursor, transaction
 
-__all__ = ["get_connection"]
+__all__ = ["get_connection", "get_pooled_connection", "release_connection", "pg_cursor", "transaction"]
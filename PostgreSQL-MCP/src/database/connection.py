@@ -3,18 +3,27 @@ Database connection management module.
 Handles PostgreSQL connection creation and cleanup.
 """
 
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
 import psycopg2
 from psycopg2.extensions import connection as psycopg2_connection
+from psycopg2.extensions import cursor as psycopg2_cursor
+from psycopg2.pool import ThreadedConnectionPool
 from src.config import DatabaseConfig
 
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
 
 def get_connection() -> psycopg2_connection:
     """
     Create and return a PostgreSQL database connection.
-    
+
     Returns:
         psycopg2.extensions.connection: Active database connection
-        
+
     Raises:
         psycopg2.Error: If connection fails
     """
@@ -23,3 +32,116 @@ def get_connection() -> psycopg2_connection:
         return conn
     except psycopg2.Error as e:
         raise Exception(f"Failed to connect to database: {e}")
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    """Create the process-wide connection pool on first use."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                try:
+                    _pool = ThreadedConnectionPool(
+                        DatabaseConfig.POOL_MIN,
+                        DatabaseConfig.POOL_MAX,
+                        **DatabaseConfig.to_dict()
+                    )
+                except psycopg2.Error as e:
+                    raise Exception(f"Failed to connect to database: {e}")
+    return _pool
+
+
+def get_pooled_connection() -> psycopg2_connection:
+    """
+    Check a connection out of the shared pool.
+
+    The connection must be handed back with release_connection(), never
+    closed directly.
+
+    Returns:
+        psycopg2.extensions.connection: Pooled database connection
+    """
+    try:
+        return _get_pool().getconn()
+    except psycopg2.Error as e:
+        raise Exception(f"Failed to connect to database: {e}")
+
+
+def release_connection(conn: psycopg2_connection) -> None:
+    """
+    Return a pooled connection. Any open transaction is rolled back and
+    broken connections are discarded by the pool.
+    """
+    _get_pool().putconn(conn)
+
+
+@contextmanager
+def pg_cursor(
+    conn: Optional[psycopg2_connection] = None,
+    autocommit: bool = False,
+    readonly: bool = False,
+) -> Iterator[psycopg2_cursor]:
+    """
+    Yield a cursor on a pooled connection.
+    
+    Commits when the block exits normally; on error the transaction is
+    rolled back as the connection goes back to the pool.
+    
+    Args:
+        conn: Connection of an enclosing transaction(); the cursor joins it
+              and committing is left to the transaction
+        autocommit: Run without BEGIN/COMMIT (single-statement writes and
+                    plain reads that need no transaction)
+        readonly: Run in a READ ONLY transaction that is rolled back, never
+                  committed; inside a joined transaction the block's effects
+                  are rolled back to a savepoint instead
+    """
+    if conn is not None:
+        with conn.cursor() as cur:
+            if readonly:
+                cur.execute("SAVEPOINT pg_cursor_readonly")
+            yield cur
+            if readonly:
+                cur.execute("ROLLBACK TO SAVEPOINT pg_cursor_readonly")
+        return
+    
+    conn = get_pooled_connection()
+    try:
+        if autocommit:
+            conn.autocommit = True
+        elif readonly:
+            # Sent as part of BEGIN, so writes fail instead of being committed
+            conn.readonly = True
+        with conn.cursor() as cur:
+            yield cur
+        if not (autocommit or readonly):
+            conn.commit()
+    finally:
+        if not conn.closed:
+            # Pooled connections are handed out in read-write transactional mode
+            if autocommit:
+                conn.autocommit = False
+            elif readonly:
+                conn.rollback()
+                conn.readonly = None
+        release_connection(conn)
+
+
+@contextmanager
+def transaction() -> Iterator[psycopg2_connection]:
+    """
+    Group several operations into one transaction (and one commit).
+    
+    Pass the yielded connection as `conn=` to CRUD operations. Commits when
+    the block exits normally and rolls back if it raises.
+    """
+    conn = get_pooled_connection()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        release_connection(conn)
@@ -5,21 +5,55 @@ Uses PlantUML's HTTP API.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import zlib
 import base64
+import hashlib
+import logging
+import shutil
 import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, Literal
 
+from .plantuml_gen import generate_plantuml_erd, generate_plantuml_class, generate_plantuml_component
+
+# Diagnostics go to stderr via logging: stdout carries the MCP stdio JSON-RPC stream
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the output dir holding renders keyed by content hash
+RENDER_CACHE_DIR = ".cache"
+
+# Concurrent requests to the PlantUML server (enough for every default job at once)
+RENDER_WORKERS = 8
+
+# Shared keep-alive connections to the PlantUML server, one per render worker
+_http = requests.Session()
+_http.mount("http://", HTTPAdapter(pool_maxsize=RENDER_WORKERS))
+_http.mount("https://", HTTPAdapter(pool_maxsize=RENDER_WORKERS))
+
+# Standard base64 alphabet -> PlantUML's, applied to the encoded bytes
+PLANTUML_ALPHABET = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/',
+    b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_'
+)
+
+# Output formats served by the PlantUML API (anything else renders as SVG)
+RENDER_FORMATS = frozenset({"png", "svg", "pdf"})
+
+# Diagram name prefix -> PlantUML syntax generator
+DIAGRAM_GENERATORS = (
+    ("erd", generate_plantuml_erd),
+    ("class", generate_plantuml_class),
+    ("component", generate_plantuml_component),
+)
+
 
 def encode_plantuml(text: str) -> str:
     """Encode PlantUML syntax to its custom base64 format."""
     zlibbed_str = zlib.compress(text.encode('utf-8'))
     compressed_string = zlibbed_str[2:-4]
-    return base64.b64encode(compressed_string).decode('utf-8').translate(
-        str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/',
-                      '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_')
-    )
+    return base64.b64encode(compressed_string).translate(PLANTUML_ALPHABET).decode('ascii')
 
 class DiagramRenderer:
     """
@@ -34,6 +68,8 @@ class DiagramRenderer:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.output_dir / RENDER_CACHE_DIR
+        self.cache_dir.mkdir(exist_ok=True)
     
     def render_to_file(
         self,
@@ -44,6 +80,10 @@ class DiagramRenderer:
         """
         Render PlantUML diagram to file.
         
+        Renders are stored under RENDER_CACHE_DIR by a SHA-256 of the server
+        URL, format and syntax, so identical syntax is copied from the cache
+        instead of hitting the API again.
+        
         Args:
             plantuml_syntax: PlantUML diagram syntax
             filename: Output filename (without extension)
@@ -52,7 +92,24 @@ class DiagramRenderer:
         Returns:
             Path to rendered file, or None if rendering failed
         """
-        return self._render_api(plantuml_syntax, filename, format)
+        key = hashlib.sha256(
+            f"{self.PLANTUML_API_BASE}\n{format}\n{plantuml_syntax}".encode('utf-8')
+        ).hexdigest()
+        cached_file = self.cache_dir / f"{key}.{format}"
+        
+        if cached_file.exists():
+            output_file = self.output_dir / f"{filename}.{format}"
+            shutil.copyfile(cached_file, output_file)
+            return output_file
+        
+        path = self._render_api(plantuml_syntax, filename, format)
+        if path:
+            try:
+                shutil.copyfile(path, cached_file)
+            except OSError as e:
+                # The render itself succeeded; only the next run loses the cache hit
+                logger.warning("Could not cache %s: %s", path, e)
+        return path
     
     def _render_api(
         self,
@@ -64,17 +121,11 @@ class DiagramRenderer:
         try:
             encoded = encode_plantuml(plantuml_syntax)
             
-            format_map = {
-                "png": "png",
-                "svg": "svg",
-                "pdf": "pdf"
-            }
-            
-            api_format = format_map.get(format, "svg")
+            api_format = format if format in RENDER_FORMATS else "svg"
             url = f"{self.PLANTUML_API_BASE}/{api_format}/{encoded}"
             
             # Make API request
-            response = requests.get(url, timeout=30)
+            response = _http.get(url, timeout=30)
             response.raise_for_status()
             
             # Save to file
@@ -84,24 +135,21 @@ class DiagramRenderer:
             return output_file
             
         except requests.RequestException as e:
-            print(f"API rendering failed ({e.__class__.__name__}): {e}")
+            logger.warning("API rendering failed (%s): %s", e.__class__.__name__, e)
             return None
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            logger.warning("Unexpected error: %s", e)
             return None
     
     def render_erd(self, schema: Dict, output_format: str = "svg", filename: str = "database_erd") -> Optional[Path]:
-        from .plantuml_gen import generate_plantuml_erd
         syntax = generate_plantuml_erd(schema)
         return self.render_to_file(syntax, filename, output_format)
     
     def render_class_diagram(self, schema: Dict, output_format: str = "svg", filename: str = "database_class") -> Optional[Path]:
-        from .plantuml_gen import generate_plantuml_class
         syntax = generate_plantuml_class(schema)
         return self.render_to_file(syntax, filename, output_format)
         
     def render_component_diagram(self, schema: Dict, output_format: str = "svg", filename: str = "database_component") -> Optional[Path]:
-        from .plantuml_gen import generate_plantuml_component
         syntax = generate_plantuml_component(schema)
         return self.render_to_file(syntax, filename, output_format)
     
@@ -117,22 +165,35 @@ def render_database_diagrams(
 ) -> Dict[str, Path]:
     """
     Render all database diagrams via PlantUML.
+
+    Diagrams are rendered concurrently; unchanged diagrams are served from
+    the content-hash cache in <output_dir>/.cache.
     """
     renderer = DiagramRenderer(output_dir)
+
+    syntaxes = [(name, generate(schema)) for name, generate in DIAGRAM_GENERATORS]
+    # Per format: erd, class, component
+    jobs = [
+        (f"{name}_{format}", syntax, format)
+        for format in formats
+        for name, syntax in syntaxes
+    ]
+
     results = {}
-    
-    for format in formats:
-        # Render ERD
-        erd_path = renderer.render_erd(schema, format, f"erd_{format}")
-        if erd_path:
-            results[f"erd_{format}"] = erd_path
-            
-        class_path = renderer.render_class_diagram(schema, format, f"class_{format}")
-        if class_path:
-            results[f"class_{format}"] = class_path
-            
-        comp_path = renderer.render_component_diagram(schema, format, f"component_{format}")
-        if comp_path:
-            results[f"component_{format}"] = comp_path
-    
+    with ThreadPoolExecutor(max_workers=min(RENDER_WORKERS, len(jobs) or 1)) as pool:
+        futures = [
+            (key, pool.submit(renderer.render_to_file, syntax, key, format))
+            for key, syntax, format in jobs
+        ]
+        # Collected in submission order so the result keys keep a stable order
+        for key, future in futures:
+            try:
+                path = future.result()
+            except Exception as e:
+                # One failed diagram must not drop the rest
+                logger.warning("Rendering %s failed: %s", key, e)
+                continue
+            if path:
+                results[key] = path
+
     return results
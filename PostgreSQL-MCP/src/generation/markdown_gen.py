@@ -16,39 +16,39 @@ def generate_markdown(schema: Dict) -> str:
     Returns:
         str: Markdown formatted documentation
     """
-    md = "# Database Documentation\n\n"
-    md += "**Auto-generated by SchemaIntelligence**\n\n"
+    parts = ["# Database Documentation\n\n", "**Auto-generated by SchemaIntelligence**\n\n"]
+    append = parts.append
 
     for table, info in schema.items():
-        md += f"## {table}\n"
-        md += f"**Primary Key:** {', '.join(info['primary_key']) if info['primary_key'] else 'None'}\n\n"
+        append(f"## {table}\n")
+        append(f"**Primary Key:** {', '.join(info['primary_key']) if info['primary_key'] else 'None'}\n\n")
 
         # Columns section
-        md += "### Columns\n\n"
-        md += "| Name | Type | Nullable |\n"
-        md += "|------|------|----------|\n"
+        append("### Columns\n\n")
+        append("| Name | Type | Nullable |\n")
+        append("|------|------|----------|\n")
         
         for col in info["columns"]:
             nullable = "✓" if col["nullable"] else "✗"
-            md += f"| `{col['name']}` | `{col['type']}` | {nullable} |\n"
+            append(f"| `{col['name']}` | `{col['type']}` | {nullable} |\n")
 
         # Foreign keys section
         if info["foreign_keys"]:
-            md += "\n### Foreign Keys\n\n"
-            md += "| Column | References | Type |\n"
-            md += "|--------|------------|------|\n"
+            append("\n### Foreign Keys\n\n")
+            append("| Column | References | Type |\n")
+            append("|--------|------------|------|\n")
             
             for fk in info["foreign_keys"]:
                 join_type = "LEFT" if fk['nullable'] else "INNER"
-                md += (
+                append(
                     f"| `{fk['column']}` | "
                     f"`{fk['references_table']}({fk['references_column']})` | "
                     f"{join_type} |\n"
                 )
 
-        md += "\n---\n\n"
+        append("\n---\n\n")
 
-    return md
+    return "".join(parts)
 
 
 def generate_table_documentation(table_name: str, table_info: Dict) -> str:
@@ -17,21 +17,18 @@ def generate_plantuml_erd(schema: Dict) -> str:
         str: PlantUML ERD syntax
     """
     lines = ["@startuml", "hide circle", "skinparam linetype ortho"]
+    append = lines.append
 
     # Add entities with columns
     for table, info in schema.items():
-        lines.append(f"entity \"{table}\" as {table} {{")
-        # primary keys first if identifiable
-        for col in info["columns"]:
-            col_name = col['name']
-            col_type = col['type']
-            marks = ""
-            if any(col_name in pk for pk in info.get("primary_keys", [])):
-                marks = "  * "
-            else:
-                marks = "  "
-            lines.append(f"{marks}{col_name} : {col_type}")
-        lines.append("}")
+        append(f"entity \"{table}\" as {table} {{")
+        # primary key columns are marked with *
+        pk_cols = set(info.get("primary_key", []))
+        lines.extend(
+            f"{'  * ' if col['name'] in pk_cols else '  '}{col['name']} : {col['type']}"
+            for col in info["columns"]
+        )
+        append("}")
 
     # Add relationships
     for table, info in schema.items():
@@ -39,9 +36,9 @@ def generate_plantuml_erd(schema: Dict) -> str:
             ref_table = fk['references_table']
             nullable = fk.get("nullable", True)
             relationship = "}o--||" if nullable else "}o-||"
-            lines.append(f"{table} {relationship} {ref_table} : \"{fk['column']}\"")
+            append(f"{table} {relationship} {ref_table} : \"{fk['column']}\"")
 
-    lines.append("@enduml")
+    append("@enduml")
     return "\n".join(lines)
 
 
@@ -56,18 +53,18 @@ def generate_plantuml_class(schema: Dict) -> str:
         str: PlantUML Class diagram syntax
     """
     lines = ["@startuml"]
+    append = lines.append
     
     for table, info in schema.items():
-        lines.append(f"class {table} {{")
-        for col in info["columns"]:
-            lines.append(f"  + {col['name']}: {col['type']}")
-        lines.append("}")
+        append(f"class {table} {{")
+        lines.extend(f"  + {col['name']}: {col['type']}" for col in info["columns"])
+        append("}")
         
     for table, info in schema.items():
         for fk in info["foreign_keys"]:
-            lines.append(f"{table} --> {fk['references_table']} : {fk['column']}")
+            append(f"{table} --> {fk['references_table']} : {fk['column']}")
             
-    lines.append("@enduml")
+    append("@enduml")
     return "\n".join(lines)
 
 
@@ -82,13 +79,14 @@ def generate_plantuml_component(schema: Dict) -> str:
         str: PlantUML Component diagram syntax
     """
     lines = ["@startuml"]
+    append = lines.append
     
     for table in schema.keys():
-        lines.append(f"component [{table}]")
+        append(f"component [{table}]")
         
     for table, info in schema.items():
         for fk in info["foreign_keys"]:
-            lines.append(f"[{table}] ..> [{fk['references_table']}] : uses")
+            append(f"[{table}] ..> [{fk['references_table']}] : uses")
             
-    lines.append("@enduml")
+    append("@enduml")
     return "\n".join(lines)
@@ -3,11 +3,52 @@ Ollama LLM integration module.
 Handles communication with Ollama for AI-powered schema analysis.
 """
 
+import hashlib
 import json
+import logging
+import os
+import tempfile
+import time
 import requests
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from src.config import OllamaConfig
 
+logger = logging.getLogger(__name__)
+
+
+SCHEMA_PROMPT = """You are a senior database architect.
+
+Analyze the following PostgreSQL schema JSON.
+
+Tasks:
+1. Explain what this database likely does in business terms.
+2. Identify relationships (explicit or implicit).
+3. Detect possible foreign keys based on column naming like *_id.
+4. Suggest join types (INNER vs LEFT).
+5. Generate an improved PlantUML ER diagram.
+6. Provide insights about structure quality.
+
+Return response in structured JSON with keys:
+- business_explanation (string)
+- detected_relationships (list of dicts)
+- join_recommendations (list of dicts)
+- plantuml_erd (string)
+- insights (list of strings)
+
+Schema:
+{schema_json}
+"""
+
+# Shared across analyzers so calls to the Ollama server reuse kept-alive connections
+_http = requests.Session()
+
+# Seconds a fetched model list is reused before /api/tags is queried again
+MODELS_TTL = 10
+
+# base_url -> (fetched at, model names in server order, same names as a set)
+_models_cache: Dict[str, Tuple[float, List[str], FrozenSet[str]]] = {}
+
 
 class OllamaAnalyzer:
     """
@@ -26,6 +67,45 @@ class OllamaAnalyzer:
         self.model = model or OllamaConfig.MODEL
         self.base_url = base_url or OllamaConfig.BASE_URL
         self.timeout = OllamaConfig.TIMEOUT
+        self.cache_dir = Path(OllamaConfig.CACHE_DIR)
+    
+    def _cache_path(self, schema: Dict) -> Path:
+        """Cache file for a schema/model/prompt combination."""
+        fingerprint = "\0".join([
+            json.dumps(schema, sort_keys=True, default=str),
+            self.model,
+            SCHEMA_PROMPT,
+        ])
+        key = hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def get_cached_explanation(self, schema: Dict) -> Optional[Dict]:
+        """
+        Return a previously stored explanation for this exact schema and model.
+        
+        Args:
+            schema: Database schema dictionary
+            
+        Returns:
+            Dict: Cached analysis, or None if there is none
+        """
+        try:
+            return json.loads(self._cache_path(schema).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+    
+    def _store_explanation(self, schema: Dict, analysis: Dict) -> None:
+        """Persist an explanation atomically; cache failures are not fatal."""
+        try:
+            data = json.dumps(analysis)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self._cache_path(schema))
+        except (OSError, TypeError, ValueError) as e:
+            # Not print(): stdout carries the MCP stdio JSON-RPC stream
+            logger.warning("Failed to cache LLM explanation: %s", e)
     
     def explain_schema(self, schema: Dict) -> Dict:
         """
@@ -38,51 +118,50 @@ class OllamaAnalyzer:
             Dict: Analysis including business explanation, relationships,
                   join recommendations, ERD, and quality insights
         """
-        
-        prompt = f"""You are a senior database architect.
-
-Analyze the following PostgreSQL schema JSON.
-
-Tasks:
-1. Explain what this database likely does in business terms.
-2. Identify relationships (explicit or implicit).
-3. Detect possible foreign keys based on column naming like *_id.
-4. Suggest join types (INNER vs LEFT).
-5. Generate an improved PlantUML ER diagram.
-6. Provide insights about structure quality.
-
-Return response in structured JSON with keys:
-- business_explanation (string)
-- detected_relationships (list of dicts)
-- join_recommendations (list of dicts)
-- plantuml_erd (string)
-- insights (list of strings)
-
-Schema:
-{json.dumps(schema, indent=2)}
-"""
+        # Compact separators: the model doesn't need indentation, and the
+        # whitespace only adds prompt tokens
+        schema_json = json.dumps(schema, separators=(',', ':'), default=str)
+        prompt = SCHEMA_PROMPT.format(schema_json=schema_json)
 
         try:
-            response = requests.post(
+            # Streamed as one small JSON object per line; tokens arrive as
+            # they are generated instead of after the whole completion
+            with _http.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
                     "prompt": prompt,
-                    "stream": False
+                    "stream": True
                 },
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            result = response.json()["response"]
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                parts = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if "error" in chunk:
+                        return {"error": f"Ollama error: {chunk['error']}"}
+                    parts.append(chunk.get("response", ""))
+                    if chunk.get("done"):
+                        break
+            result = "".join(parts)
             
             # Try to parse as JSON, fall back to string if not valid JSON
             try:
-                return json.loads(result)
+                analysis = json.loads(result)
             except json.JSONDecodeError:
-                return {"llm_analysis": result}
+                analysis = {"llm_analysis": result}
+            
+            self._store_explanation(schema, analysis)
+            return analysis
                 
         except requests.RequestException as e:
             return {"error": f"Failed to call Ollama: {str(e)}"}
+        except ValueError as e:
+            return {"error": f"Invalid response from Ollama: {str(e)}"}
     
     def get_available_models(self) -> list:
         """
@@ -92,16 +171,28 @@ Schema:
             list: List of available model names
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/api/tags",
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [model["name"] for model in data.get("models", [])]
+            names, _ = self._fetch_models()
+            return list(names)
         except requests.RequestException as e:
             return []
     
+    def _fetch_models(self) -> Tuple[List[str], FrozenSet[str]]:
+        """Model names from /api/tags, reused for MODELS_TTL seconds per server."""
+        cached = _models_cache.get(self.base_url)
+        if cached and time.monotonic() - cached[0] < MODELS_TTL:
+            return cached[1], cached[2]
+        
+        response = _http.get(
+            f"{self.base_url}/api/tags",
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        data = response.json()
+        names = [model["name"] for model in data.get("models", [])]
+        model_set = frozenset(names)
+        _models_cache[self.base_url] = (time.monotonic(), names, model_set)
+        return names, model_set
+    
     def is_available(self) -> bool:
         """
         Check if Ollama server is available and model exists.
@@ -110,7 +201,7 @@ Schema:
             bool: True if server is reachable and model exists
         """
         try:
-            models = self.get_available_models()
-            return self.model in models
+            _, model_set = self._fetch_models()
+            return self.model in model_set
         except:
             return False
@@ -1,5 +1,6 @@
 """Schema extraction module for SchemaIntelligence"""
 
-from .extractor import extract_schema
+from .extractor import extract_schema, get_tables_list
+from .cache import get_cached_schema, get_table_info
 
-__all__ = ["extract_schema"]
+__all__ = ["extract_schema", "get_tables_list", "get_cached_schema", "get_table_info"]
@@ -0,0 +1,60 @@
+"""
+Schema cache module.
+Reuses the extracted schema across tool calls until it expires or DDL changes it.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from .extractor import extract_schema
+
+# Seconds an extracted schema is reused before information_schema is queried again
+DEFAULT_TTL = 30
+
+_lock = threading.Lock()
+_schema: Optional[Dict] = None
+_extracted_at = 0.0
+
+
+def get_cached_schema(ttl: float = DEFAULT_TTL) -> Dict:
+    """
+    Return the database schema, re-extracting it once the cached copy is stale.
+
+    Args:
+        ttl: Maximum age in seconds of a cached schema
+
+    Returns:
+        Dict: Schema in the same structure as extract_schema()
+    """
+    global _schema, _extracted_at
+
+    with _lock:
+        if _schema is None or time.monotonic() - _extracted_at > ttl:
+            _schema = extract_schema()
+            _extracted_at = time.monotonic()
+        return _schema
+
+
+def invalidate() -> None:
+    """Drop the cached schema so the next caller re-extracts it."""
+    global _schema
+
+    with _lock:
+        _schema = None
+
+
+def get_table_info(table_name: str) -> Dict:
+    """
+    Get information for a specific table.
+    
+    Served from the schema cache, so repeated lookups do not re-extract
+    the whole schema; DDL made through this server invalidates it.
+    
+    Args:
+        table_name: Name of the table
+        
+    Returns:
+        Dict: Table information
+    """
+    return get_cached_schema().get(table_name, {})
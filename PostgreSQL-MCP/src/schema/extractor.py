@@ -3,8 +3,67 @@ Schema extraction module.
 Extracts table structure, columns, keys, and relationships from PostgreSQL.
 """
 
-from typing import Dict, List
-from src.database import get_connection
+from typing import Dict, Iterator, List
+from src.database import pg_cursor, transaction
+
+# Each query covers the whole public schema; extract_schema() buckets the
+# rows by table in Python instead of issuing three queries per table.
+
+TABLES_SQL = """
+    SELECT table_name
+    FROM information_schema.tables
+    WHERE table_schema = 'public'
+    AND table_type = 'BASE TABLE'
+    ORDER BY table_name;
+"""
+
+# Columns with type and nullability
+COLUMNS_SQL = """
+    SELECT table_name, column_name, data_type, is_nullable
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+    ORDER BY table_name, ordinal_position;
+"""
+
+# Primary keys (in key column order)
+PRIMARY_KEYS_SQL = """
+    SELECT c.relname, a.attname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = i.indrelid
+                        AND a.attnum = ANY(i.indkey)
+    WHERE n.nspname = 'public'
+    AND i.indisprimary
+    ORDER BY c.relname, array_position(i.indkey::smallint[], a.attnum);
+"""
+
+# Foreign keys with the referenced table and column
+FOREIGN_KEYS_SQL = """
+    SELECT
+        tc.table_name,
+        kcu.column_name,
+        ccu.table_name,
+        ccu.column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+      ON tc.constraint_name = kcu.constraint_name
+    JOIN information_schema.constraint_column_usage ccu
+      ON ccu.constraint_name = tc.constraint_name
+    WHERE constraint_type = 'FOREIGN KEY'
+      AND tc.table_schema = 'public';
+"""
+
+# Rows fetched per round trip by the server-side catalog cursors
+SCHEMA_ITERSIZE = 2000
+
+
+def _iter_rows(conn, name: str, query: str) -> Iterator[tuple]:
+    """Stream a query's rows through a named (server-side) cursor."""
+    with conn.cursor(name=name) as cur:
+        cur.itersize = SCHEMA_ITERSIZE
+        cur.execute(query)
+        yield from cur
 
 
 def extract_schema() -> Dict:
@@ -22,100 +81,53 @@ def extract_schema() -> Dict:
                 }
             }
     """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get all tables
-    cur.execute("""
-        SELECT table_name
-        FROM information_schema.tables
-        WHERE table_schema = 'public'
-        AND table_type = 'BASE TABLE';
-    """)
-    tables = [row[0] for row in cur.fetchall()]
-
-    schema = {}
-
-    for table in tables:
-        schema[table] = {
-            "columns": [],
-            "primary_key": [],
-            "foreign_keys": []
-        }
+    # Server-side cursors stream large catalogs in SCHEMA_ITERSIZE batches
+    # instead of materializing every row with fetchall()
+    with transaction() as conn:
+        # Get all tables
+        schema = {}
+        for (table,) in _iter_rows(conn, "schema_tables", TABLES_SQL):
+            schema[table] = {
+                "columns": [],
+                "primary_key": [],
+                "foreign_keys": []
+            }
 
         # Extract columns with type and nullability
-        cur.execute("""
-            SELECT column_name, data_type, is_nullable
-            FROM information_schema.columns
-            WHERE table_name = %s;
-        """, (table,))
-        
-        for col_name, data_type, is_nullable in cur.fetchall():
-            schema[table]["columns"].append({
-                "name": col_name,
-                "type": data_type,
-                "nullable": is_nullable == "YES"
-            })
-
-        # Extract primary keys
-        cur.execute("""
-            SELECT a.attname
-            FROM pg_index i
-            JOIN pg_attribute a ON a.attrelid = i.indrelid
-                                AND a.attnum = ANY(i.indkey)
-            WHERE i.indrelid = %s::regclass
-            AND i.indisprimary;
-        """, (table,))
-        schema[table]["primary_key"] = [row[0] for row in cur.fetchall()]
+        # (table, column) -> nullable, for the FK lookups below
+        nullable_by_column = {}
+        columns = _iter_rows(conn, "schema_columns", COLUMNS_SQL)
+        for table, col_name, data_type, is_nullable in columns:
+            if table in schema:
+                nullable = is_nullable == "YES"
+                schema[table]["columns"].append({
+                    "name": col_name,
+                    "type": data_type,
+                    "nullable": nullable
+                })
+                nullable_by_column[(table, col_name)] = nullable
+
+        # Extract primary keys (in key column order)
+        for table, col in _iter_rows(conn, "schema_pks", PRIMARY_KEYS_SQL):
+            if table in schema:
+                schema[table]["primary_key"].append(col)
 
         # Extract foreign keys with nullable info
-        cur.execute("""
-            SELECT
-                kcu.column_name,
-                ccu.table_name,
-                ccu.column_name
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.key_column_usage kcu
-              ON tc.constraint_name = kcu.constraint_name
-            JOIN information_schema.constraint_column_usage ccu
-              ON ccu.constraint_name = tc.constraint_name
-            WHERE constraint_type = 'FOREIGN KEY'
-              AND tc.table_name=%s;
-        """, (table,))
-
-        for col, ref_table, ref_col in cur.fetchall():
-            # Get nullable status for FK column
-            nullable = next(
-                (c["nullable"] for c in schema[table]["columns"] if c["name"] == col),
-                True
-            )
+        foreign_keys = _iter_rows(conn, "schema_fks", FOREIGN_KEYS_SQL)
+        for table, col, ref_table, ref_col in foreign_keys:
+            if table not in schema:
+                continue
 
             schema[table]["foreign_keys"].append({
                 "column": col,
                 "references_table": ref_table,
                 "references_column": ref_col,
-                "nullable": nullable
+                "nullable": nullable_by_column.get((table, col), True)
             })
 
-    cur.close()
-    conn.close()
     return schema
 
 
-def get_table_info(table_name: str) -> Dict:
-    """
-    Get information for a specific table.
-    
-    Args:
-        table_name: Name of the table
-        
-    Returns:
-        Dict: Table information
-    """
-    schema = extract_schema()
-    return schema.get(table_name, {})
-
-
 def get_tables_list() -> List[str]:
     """
     Get list of all tables in the database.
@@ -123,18 +135,8 @@ def get_tables_list() -> List[str]:
     Returns:
         List[str]: List of table names
     """
-    conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("""
-        SELECT table_name
-        FROM information_schema.tables
-        WHERE table_schema = 'public'
-        AND table_type = 'BASE TABLE'
-        ORDER BY table_name;
-    """)
+    with pg_cursor() as cur:
+        cur.execute(TABLES_SQL)
+        tables = [row[0] for row in cur.fetchall()]
     
-    tables = [row[0] for row in cur.fetchall()]
-    cur.close()
-    conn.close()
     return tables
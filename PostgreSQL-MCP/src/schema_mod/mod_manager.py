@@ -5,8 +5,8 @@ All identifiers are strictly validated to prevent SQL injection.
 
 import time
 from typing import Any, Dict, List, Optional
-import psycopg2
-from src.database import get_connection
+from src.database import pg_cursor
+from src.schema import cache as schema_cache
 from .mod_validator import SchemaModValidator
 
 
@@ -60,10 +60,9 @@ def schema_add_column(table_name: str, column: Dict[str, Any]) -> Dict[str, Any]
             # Simplified for safety: skipping complex default parsing in initial ADD
             pass
 
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
+        schema_cache.invalidate()
             
         return _format_result(
             status="success",
@@ -93,10 +92,9 @@ def schema_modify_column_type(table_name: str, column_name: str, new_type: str,
             # Ex: "column_name::integer"
             query += f" USING {using_expression}"
             
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
+        schema_cache.invalidate()
             
         return _format_result(
             status="success",
@@ -122,10 +120,9 @@ def schema_drop_column(table_name: str, column_name: str, cascade: bool = False)
         if cascade:
             query += " CASCADE"
             
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
+        schema_cache.invalidate()
             
         return _format_result(
             status="success",
@@ -150,10 +147,9 @@ def schema_set_column_nullable(table_name: str, column_name: str, is_nullable: b
         action = "DROP NOT NULL" if is_nullable else "SET NOT NULL"
         query = f"ALTER TABLE {table_name} ALTER COLUMN {column_name} {action}"
         
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
+        schema_cache.invalidate()
             
         return _format_result(
             status="success",
@@ -191,13 +187,12 @@ def schema_list_indexes(table_name: Optional[str] = None) -> Dict[str, Any]:
             query += " AND tablename = %s"
             params.append(table_name)
             
-        with get_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) if hasattr(psycopg2, 'extras') else conn.cursor() as cur:
-                cur.execute(query, params)
-                
-                # Fetch dictionary results
-                columns = [desc[0] for desc in cur.description]
-                results = [dict(zip(columns, row)) for row in cur.fetchall()]
+        with pg_cursor() as cur:
+            cur.execute(query, params)
+            
+            # Fetch dictionary results
+            columns = [desc[0] for desc in cur.description]
+            results = [dict(zip(columns, row)) for row in cur.fetchall()]
                 
         return _format_result(
             status="success",
@@ -222,10 +217,8 @@ def schema_drop_index(index_name: str, cascade: bool = False) -> Dict[str, Any]:
         if cascade:
             query += " CASCADE"
             
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
             
         return _format_result(
             status="success",
@@ -263,11 +256,10 @@ def schema_list_constraints(table_name: Optional[str] = None) -> Dict[str, Any]:
             query += " AND conrelid::regclass::text = %s"
             params.append(table_name)
             
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query, params)
-                columns = [desc[0] for desc in cur.description]
-                results = [dict(zip(columns, row)) for row in cur.fetchall()]
+        with pg_cursor() as cur:
+            cur.execute(query, params)
+            columns = [desc[0] for desc in cur.description]
+            results = [dict(zip(columns, row)) for row in cur.fetchall()]
                 
         return _format_result(
             status="success",
@@ -298,10 +290,9 @@ def schema_add_primary_key(table_name: str, columns: List[str], constraint_name:
         else:
             query = f"ALTER TABLE {table_name} ADD PRIMARY KEY ({cols_str})"
             
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
+        schema_cache.invalidate()
             
         return _format_result(
             status="success",
@@ -346,10 +337,9 @@ def schema_add_foreign_key(
             
         query = f"ALTER TABLE {table_name} ADD {constraint_clause} FOREIGN KEY ({cols_str}) REFERENCES {ref_table}({ref_cols_str}) ON DELETE {on_delete}"
         
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
+        schema_cache.invalidate()
             
         return _format_result(
             status="success",
@@ -375,10 +365,9 @@ def schema_drop_constraint(table_name: str, constraint_name: str, cascade: bool
         if cascade:
             query += " CASCADE"
             
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
+        schema_cache.invalidate()
             
         return _format_result(
             status="success",
@@ -407,10 +396,9 @@ def schema_list_views() -> Dict[str, Any]:
         WHERE table_schema NOT IN ('pg_catalog', 'information_schema')
         """
         
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-                results = [row[0] for row in cur.fetchall()]
+        with pg_cursor() as cur:
+            cur.execute(query)
+            results = [row[0] for row in cur.fetchall()]
                 
         return _format_result(
             status="success",
@@ -437,11 +425,10 @@ def schema_get_view_definition(view_name: str) -> Dict[str, Any]:
         WHERE table_name = %s AND table_schema NOT IN ('pg_catalog', 'information_schema')
         """
         
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query, (view_name,))
-                row = cur.fetchone()
-                definition = row[0] if row else None
+        with pg_cursor() as cur:
+            cur.execute(query, (view_name,))
+            row = cur.fetchone()
+            definition = row[0] if row else None
                 
         if not definition:
             raise ValueError(f"View {view_name} not found")
@@ -469,10 +456,8 @@ def schema_drop_view(view_name: str, cascade: bool = False) -> Dict[str, Any]:
         if cascade:
             query += " CASCADE"
             
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-            conn.commit()
+        with pg_cursor() as cur:
+            cur.execute(query)
             
         return _format_result(
             status="success",
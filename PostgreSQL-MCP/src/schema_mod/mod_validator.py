@@ -3,8 +3,7 @@ Validation module for Schema Modification operations (Phase 2).
 """
 
 from typing import Any, Dict, List, Optional
-import re
-from src.crud.crud_validator import CRUDValidator
+from src.crud.crud_validator import CRUDValidator, is_valid_identifier
 
 
 class SchemaModValidator(CRUDValidator):
@@ -18,7 +17,7 @@ class SchemaModValidator(CRUDValidator):
         if not isinstance(constraint_name, str):
             raise ValueError("Constraint name must be a string")
             
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", constraint_name):
+        if not is_valid_identifier(constraint_name):
             raise ValueError(
                 f"Invalid constraint name '{constraint_name}'. Must start with letter or underscore, "
                 "contain only alphanumeric characters and underscores."
@@ -30,7 +29,7 @@ class SchemaModValidator(CRUDValidator):
         if not index_name or not isinstance(index_name, str):
             raise ValueError("Index name must be a non-empty string")
             
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", index_name):
+        if not is_valid_identifier(index_name):
             raise ValueError(f"Invalid index name '{index_name}'")
         return True
 
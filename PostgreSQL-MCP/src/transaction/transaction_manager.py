@@ -6,7 +6,9 @@ Phase 5A: execute_transaction, backup_table
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+from src.crud import invalidate_counts
 from src.database import get_connection
+from src.schema import cache as schema_cache
 
 
 def _format_result(
@@ -187,6 +189,9 @@ def execute_transaction(
             
             # Commit transaction
             conn.commit()
+            # Operations may include DDL as well as data changes
+            schema_cache.invalidate()
+            invalidate_counts()
             
             duration_ms = (time.time() - start_time) * 1000
             
@@ -331,6 +336,7 @@ def backup_table(
                 warnings.append(f"Copied {len(indexes_copied)} indexes to backup table")
         
         conn.commit()
+        schema_cache.invalidate()
         
         # Get table sizes
         cursor.execute("""